@@ -1,6 +1,7 @@
 """Terminal styling for tabular data.
 
-Exposes a single entry point, the Tabular class.
+Exposes a single entry point, the Tabular class, along with AsyncTabular, its
+variant for asyncio code.
 """
 
 import sys
@@ -10,8 +11,10 @@ __version__ = "0.5.0"
 from pyout.elements import schema
 
 if sys.platform == "win32":
+    from pyout.tabular_dummy import AsyncTabular
     from pyout.tabular_dummy import Tabular
 else:
+    from pyout.tabular import AsyncTabular
     from pyout.tabular import Tabular
 
 del sys
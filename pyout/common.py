@@ -11,9 +11,14 @@ from collections import namedtuple
 from collections import OrderedDict
 from collections.abc import Mapping
 from collections.abc import Sequence
+from collections.abc import Sized
 from functools import partial
 import inspect
+from itertools import chain
+from itertools import repeat
 from logging import getLogger
+import math
+from operator import itemgetter
 
 from pyout import elements
 from pyout.field import Field
@@ -67,6 +72,7 @@ class RowNormalizer(object):
 
     def __init__(self, columns, style):
         self._columns = columns
+        self._col_to_idx = {c: idx for idx, c in enumerate(columns)}
         self.method = None
 
         self.delayed = defaultdict(list)
@@ -106,33 +112,58 @@ class RowNormalizer(object):
         return self.method(row)
 
     def _choose_normalizer(self, row):
-        if isinstance(row, Mapping):
+        # The columns that aren't delayed are read in one go by a function
+        # that is specialized here for the kind of row and the column order.
+        columns = [c for c in self._columns if c not in self.delayed_columns]
+        defaults = [(c, self.nothings[c]) for c in columns]
+        is_mapping = isinstance(row, Mapping)
+        if is_mapping:
             getter = self.getter_dict
+
+            def get_values(row):
+                get = row.get
+                return {c: get(c, nothing) for c, nothing in defaults}
         elif isinstance(row, Sequence):
             getter = self.getter_seq
+            indices = [self._col_to_idx[c] for c in columns]
+            if len(indices) == 1:
+                column, idx = columns[0], indices[0]
+
+                def get_values(row):
+                    return {column: row[idx]}
+            elif indices:
+                get_items = itemgetter(*indices)
+
+                def get_values(row):
+                    return dict(zip(columns, get_items(row)))
+            else:
+                def get_values(_):
+                    return {}
         else:
             getter = self.getter_attrs
+
+            def get_values(row):
+                return {c: getattr(row, c, nothing) for c, nothing in defaults}
         lgr.debug("Selecting %s as normalizer", getter.__name__)
-        return partial(self._normalize, getter)
+        return partial(self._normalize, getter, get_values, is_mapping)
 
-    def _normalize(self, getter, row):
-        if isinstance(row, Mapping):
+    def _normalize(self, getter, get_values, is_mapping, row):
+        if is_mapping:
             callables0 = self.strip_callables(row)
         else:
             callables0 = []
 
-        norm_row = self._maybe_delay(getter, row, self._columns)
+        norm_row = get_values(row)
+        if is_mapping and not self.delayed:
+            # The callables were already stripped from the values.
+            return callables0, norm_row
+        self._add_delayed(getter, row, norm_row)
         # We need a second pass with strip_callables because norm_row will
         # contain new callables for any delayed values.
         callables1 = self.strip_callables(norm_row)
         return callables0 + callables1, norm_row
 
-    def _maybe_delay(self, getter, row, columns):
-        row_norm = {}
-        for column in columns:
-            if column not in self.delayed_columns:
-                row_norm[column] = getter(row, column)
-
+    def _add_delayed(self, getter, row, row_norm):
         def delay(cols):
             return lambda: {c: getter(row, c) for c in cols}
 
@@ -140,7 +171,6 @@ class RowNormalizer(object):
             key = cols[0] if len(cols) == 1 else tuple(cols)
             lgr.debug("Delaying %r for row %r", cols, row)
             row_norm[key] = delay(cols)
-        return row_norm
 
     @staticmethod
     def strip_callables(row):
@@ -156,7 +186,8 @@ class RowNormalizer(object):
             column names.  The values take one of three forms: 1) a
             non-callable value, 2) a tuple (initial_value, callable), 3) or a
             single callable (in which case the initial value is set to an empty
-            string).
+            string).  Generators, awaitables, and async generators are treated
+            as callables.
 
         Returns
         -------
@@ -174,7 +205,8 @@ class RowNormalizer(object):
                 # callable with no initial value.
                 fn = value
 
-            if callable(fn) or inspect.isgenerator(fn):
+            if callable(fn) or inspect.isgenerator(fn) \
+               or inspect.isawaitable(fn) or inspect.isasyncgen(fn):
                 lgr.debug("Using %r as the initial value "
                           "for columns %r in row %r",
                           initial, columns, row)
@@ -193,6 +225,86 @@ class RowNormalizer(object):
 
         return callables
 
+    @staticmethod
+    def columnar_names(batch):
+        """Return the column names of a columnar batch.
+
+        Parameters
+        ----------
+        batch : object
+            A potential columnar batch (see `columnar`).
+
+        Returns
+        -------
+        A list of column names or None if `batch` isn't a columnar batch.
+        """
+        if isinstance(batch, Mapping):
+            return list(batch.keys())
+        # Check for a NumPy-style structured array without importing NumPy.
+        names = getattr(getattr(batch, "dtype", None), "names", None)
+        if names is not None:
+            return list(names)
+        return None
+
+    def columnar(self, batch):
+        """Normalize a batch of rows that is given as columns.
+
+        The columns are checked up front, but each row is created only when
+        the returned iterator gets to it.
+
+        Parameters
+        ----------
+        batch : mapping or structured array
+            Either a mapping from column names to sequences of values or an
+            object with a NumPy-style structured dtype (e.g., a NumPy
+            structured or record array).  Unlike the rows passed to
+            `__call__`, the values are taken as is; producers are not
+            supported.
+
+        Returns
+        -------
+        A tuple with the number of rows and an iterator over the normalized
+        rows.
+
+        Raises
+        ------
+        ValueError if `batch` isn't a columnar batch, if a column isn't a
+        sequence of values, or if the columns have different lengths.
+        """
+        names = self.columnar_names(batch)
+        if names is None:
+            raise ValueError("{!r} is not a columnar batch".format(batch))
+        if self.delayed:
+            raise ValueError("Columnar batches cannot have delayed columns")
+
+        nrows = None
+        given = {}
+        for column in names:
+            col = batch[column]
+            if isinstance(col, (str, bytes)) or not isinstance(col, Sized):
+                raise ValueError(
+                    "Expected a sequence of values for column {!r}, got {!r}"
+                    .format(column, col))
+            if nrows is None:
+                nrows = len(col)
+            elif len(col) != nrows:
+                raise ValueError("Columns in batch have different lengths")
+            given[column] = col
+        if not nrows:
+            return 0, iter([])
+
+        nothings = self.nothings
+        columns = self._columns
+        values = []
+        for column in columns:
+            col = given.get(column)
+            if col is None:
+                values.append(repeat(nothings[column], nrows))
+            else:
+                # Convert NumPy arrays to lists of Python objects in one go.
+                values.append(col.tolist() if hasattr(col, "tolist") else col)
+        return nrows, (dict(zip(columns, vals)) for vals in zip(*values))
+
     # Input-specific getters.  These exist as their own methods so that they
     # can be wrapped in a callable and delayed.
 
@@ -200,13 +312,38 @@ class RowNormalizer(object):
         return row.get(column, self.nothings[column])
 
     def getter_seq(self, row, column):
-        col_to_idx = {c: idx for idx, c in enumerate(self._columns)}
-        return row[col_to_idx[column]]
+        return row[self._col_to_idx[column]]
 
     def getter_attrs(self, row, column):
         return getattr(row, column, self.nothings[column])
 
 
+class RenderCache(object):
+    """Rendered fields of a row, for reuse by StyleFields.render.
+
+    The cache is only valid as long as the row's data and style do not change;
+    the owner of the row is responsible for calling `clear` when they do.
+
+    Attributes
+    ----------
+    epoch : int or None
+        The StyleFields epoch at the time of the last render.  None if the row
+        hasn't been rendered since the cache was cleared.
+    fields : dict
+        Maps a column name to a (width, rendered field) tuple.
+    """
+
+    __slots__ = ("epoch", "fields")
+
+    def __init__(self):
+        self.epoch = None
+        self.fields = {}
+
+    def clear(self):
+        self.epoch = None
+        self.fields.clear()
+
+
 class StyleFields(object):
     """Generate Fields based on the specified style and processors.
 
@@ -218,6 +355,10 @@ class StyleFields(object):
         This instance is used to generate the fields from `style`.
     """
 
+    # The maximum number of distinct override styles whose processors are kept
+    # around.
+    _override_max = 64
+
     def __init__(self, style, procgen):
         self.init_style = style
         self.procgen = procgen
@@ -233,6 +374,12 @@ class StyleFields(object):
 
         self.hidden = {}  # column => {True, "if-empty", False}
         self._visible_columns = None  # cached list of visible columns
+        # Incremented whenever the visible columns change, invalidating all
+        # RenderCache instances.
+        self._epoch = 0
+        # (adopt, style fingerprint) => processor key, oldest first
+        self._override_keys = OrderedDict()
+        self._override_count = 0
 
     def build(self, columns):
         """Build the style and fields.
@@ -303,6 +450,11 @@ class StyleFields(object):
         for column in self.columns:
             lgr.debug("Setting up field for column %r", column)
             cstyle = style[column]
+            if cstyle.get("delayed") and cstyle.get("executor") == "process":
+                # The accessor that reads a delayed value can't be pickled.
+                raise ValueError(
+                    "'delayed' is incompatible with an 'executor' of "
+                    "'process'")
             style_width = cstyle["width"]
 
             # Convert atomic values into the equivalent complex form.
@@ -317,7 +469,11 @@ class StyleFields(object):
                 width = frac_to_int(style_width.get("min", 0))
                 wmax = frac_to_int(style_width.get("max"))
                 autoval = {"max": wmax, "min": width,
-                           "weight": style_width.get("weight", 1)}
+                           "weight": style_width.get("weight", 1),
+                           "grow": style_width.get("grow"),
+                           "round": style_width.get("round"),
+                           "freeze": style_width.get("freeze"),
+                           "nrows": 0}
                 self.autowidth_columns[column] = autoval
                 lgr.debug("Stored auto-width value for column %r: %s",
                           column, autoval)
@@ -325,6 +481,10 @@ class StyleFields(object):
                 if "min" in style_width or "max" in style_width:
                     raise ValueError(
                         "'min' and 'max' are incompatible with 'width'")
+                if {"grow", "round", "freeze"}.intersection(style_width):
+                    raise ValueError(
+                        "'grow', 'round', and 'freeze' are incompatible "
+                        "with 'width'")
                 width = frac_to_int(style_width["width"])
                 lgr.debug("Setting width of column %r to %d",
                           column, width)
@@ -333,6 +493,9 @@ class StyleFields(object):
             # always want to be active and "default" processors that we want to
             # be active unless there's an overriding style (i.e., a header is
             # being written or the `style` argument to __call__ is specified).
+            # Each distinct overriding style gets its own key (see
+            # _proc_group), with "override" used for styles that can't be told
+            # apart.
             field = Field(width=width, align=cstyle["align"],
                           default_keys=["width", "default"],
                           other_keys=["override"])
@@ -348,6 +511,7 @@ class StyleFields(object):
             fields[column] = field
             self._truncaters[column] = truncater
         self.fields = fields
+        self._override_keys.clear()
 
     @property
     def has_header(self):
@@ -412,19 +576,60 @@ class StyleFields(object):
     def _reset_width_info(self):
         """Reset visibility-dependent information.
         """
+        self._epoch += 1
         self._visible_columns = None
         self._set_fixed_widths()
         self._check_widths()
 
-    def _set_widths(self, row, proc_group):
+    @staticmethod
+    def _grow_width(autoval, width, value_width, count_row):
+        """Return the width that a column should grow to.
+
+        Parameters
+        ----------
+        autoval : dict
+            The column's auto-width value.
+        width : int
+            The column's current width.
+        value_width : int
+            The width of the value that's being considered.
+        count_row : bool
+            Whether to count this value toward the "freeze" limit.
+
+        Returns
+        -------
+        An int that is at least `width`.
+        """
+        freeze = autoval["freeze"]
+        if freeze:
+            if autoval["nrows"] >= freeze:
+                return width
+            if count_row:
+                autoval["nrows"] += 1
+        if value_width <= width:
+            return width
+
+        grow = autoval["grow"]
+        if grow:
+            value_width = max(value_width, int(math.ceil(width * (1 + grow))))
+        multiple = autoval["round"]
+        if multiple:
+            value_width = -(-value_width // multiple) * multiple
+        return value_width
+
+    def _set_widths(self, row, proc_group, count_row=False):
         """Update auto-width Fields based on `row`.
 
         Parameters
         ----------
         row : dict
-        proc_group : {'default', 'override'}
-            Whether to consider 'default' or 'override' key for pre- and
-            post-format processors.
+        proc_group : str
+            Whether to consider the 'default' key or an override key (as
+            returned by _proc_group) for pre- and post-format processors.
+        count_row : bool, optional
+            Whether this row counts toward a column's "freeze" limit.  This
+            should be true only the first time a data row is measured (i.e.,
+            not for updates, re-measurements, or the header).
 
         Returns
         -------
@@ -466,9 +671,11 @@ class StyleFields(object):
                 value = row[column]
             value = str(value)
             value_width = len(value)
-            wmax = autowidth_columns[column]["max"]
-            wmin = autowidth_columns[column]["min"]
-            max_seen = max(value_width, field.width)
+            autoval = autowidth_columns[column]
+            wmax = autoval["max"]
+            wmin = autoval["min"]
+            max_seen = self._grow_width(autoval, field.width, value_width,
+                                        count_row)
             requested_floor = max(max_seen, wmin)
             wants = min(requested_floor, wmax or requested_floor)
             lgr.debug("value=%r, value width=%d, old field length=%d, "
@@ -516,57 +723,119 @@ class StyleFields(object):
         -------
         Dictionary mapping each auto-width column to the assigned width.
         """
-        # NOTE: The method below is not very clever and does unnecessary
-        # iteration.  It may end up being too slow, but at least it should
-        # serve to establish the baseline (along with tests) that show the
-        # desired behavior.
-
-        assigned = {}
-
-        # Make sure every column gets at least one.
-        for column in columns:
-            col_wants = columns[column]["wants"]
-            if col_wants > 0:
+        # Conceptually, widths are handed out in rounds.  Every column first
+        # gets one character.  Then, in each round, each column that still
+        # wants more claims `weight` characters (or, in the first round, enough
+        # to reach its minimum), going through the columns in a fixed order,
+        # until the available width runs out.
+        #
+        # Rather than stepping through the rounds, we find the number of
+        # rounds that can be completed and then hand out the remainder in one
+        # partial round.  After round r >= 1, a column that hasn't reached what
+        # it wants has
+        #
+        #     base + (r - 1) * weight
+        #
+        # where base is its minimum if that is above 1 and 1 + weight
+        # otherwise.
+
+        # name => (wants, weight, base, round in which wants is reached)
+        info = {}
+        for column, value in columns.items():
+            wants = value["wants"]
+            if wants > 0:
                 available -= 1
-                assigned[column] = 1
+                weight = value.get("weight", 1)
+                wmin = value["min"]
+                base = wmin if wmin > 1 else 1 + weight
+                if wants <= 1:
+                    done_round = 0
+                elif base >= wants:
+                    done_round = 1
+                else:
+                    done_round = 1 + -(-(wants - base) // weight)
+                info[column] = wants, weight, base, done_round
         assert available >= 0, "bug: upstream checks should make impossible"
 
-        weights = {c: columns[c].get("weight", 1) for c in columns}
+        if sum(i[0] - 1 for i in info.values()) <= available:
+            lgr.debug("Available width covers all requests")
+            assigned = {c: i[0] for c, i in info.items()}
+            lgr.debug("Assigned widths: %r", assigned)
+            return assigned
+
+        def has_after(round_, wants, weight, base):
+            if round_ == 0:
+                return 1
+            return min(wants, base + (round_ - 1) * weight)
+
+        # Find the number of complete rounds by walking through the rounds in
+        # which columns reach their wants.  Between those points, the total
+        # width claimed increases linearly.
+        by_done = sorted(info.values(), key=lambda i: i[3])
+        claimed_done = 0  # claimed by columns that reached their wants
+        claimed_base = sum(i[2] - 1 for i in by_done if i[3] > 0)
+        slope = sum(i[1] for i in by_done if i[3] > 0)
+        idx = 0
+        while idx < len(by_done) and by_done[idx][3] == 0:
+            idx += 1
+        lo = 1
+        nrounds = None
+        while nrounds is None:
+            if idx == len(by_done):
+                # Completing round `lo` would satisfy every column, and we know
+                # that there isn't enough available for that.
+                nrounds = lo - 1
+                break
+            # Within rounds [lo, hi], the same columns are still claiming.
+            hi = by_done[idx][3] - 1
+            if lo <= hi:
+                claimed_lo = claimed_done + claimed_base + (lo - 1) * slope
+                if claimed_lo > available:
+                    nrounds = lo - 1
+                elif claimed_lo + (hi - lo) * slope > available:
+                    nrounds = lo + (available - claimed_lo) // slope
+                else:
+                    lo = hi + 1
+            if nrounds is None:
+                round_done = by_done[idx][3]
+                while idx < len(by_done) and by_done[idx][3] == round_done:
+                    wants, weight, base, _ = by_done[idx]
+                    claimed_done += wants - 1
+                    claimed_base -= base - 1
+                    slope -= weight
+                    idx += 1
+                lo = max(lo, round_done)
+        nrounds = int(nrounds)
+        lgr.debug("Completed %d round(s) of claiming width", nrounds)
+
+        assigned = {c: has_after(nrounds, *i[:3]) for c, i in info.items()}
+        available -= sum(assigned.values()) - len(assigned)
+
         # ATTN: The sorting here needs to be stable across calls with the same
         # row so that the same assignments come out.
-        colnames = sorted(assigned.keys(), reverse=True,
-                          key=lambda c: (columns[c]["min"], weights[c], c))
-        columns_in_need = set(assigned.keys())
-        while available > 0 and columns_in_need:
-            for column in colnames:
-                if column not in columns_in_need:
-                    continue
-
-                col_wants = columns[column]["wants"] - assigned[column]
-                if col_wants < 1:
-                    columns_in_need.remove(column)
-                    continue
-
-                wmin = columns[column]["min"]
-                has = assigned[column]
-                claim = min(weights[column] if has >= wmin else wmin - has,
-                            col_wants,
-                            available)
-                available -= claim
-                assigned[column] += claim
-                lgr.log(9, "Claiming %d characters (of %d available) for %s",
-                        claim, available, column)
-                if available == 0:
-                    break
+        colnames = sorted(info.keys(), reverse=True,
+                          key=lambda c: (columns[c]["min"], info[c][1], c))
+        for column in colnames:
+            if available <= 0:
+                break
+            claim = min(has_after(nrounds + 1, *info[column][:3])
+                        - assigned[column],
+                        available)
+            available -= claim
+            assigned[column] += claim
+            lgr.log(9, "Claiming %d characters (of %d available) for %s",
+                    claim, available, column)
         lgr.debug("Available width after assigned: %s", available)
         lgr.debug("Assigned widths: %r", assigned)
         return assigned
 
     def _proc_group(self, style, adopt=True):
-        """Return whether group is "default" or "override".
+        """Return the processor key for `style`.
 
-        In the case of "override", the self.fields pre-format and post-format
-        processors will be set under the "override" key.
+        If `style` is None, the key is "default".  Otherwise, the self.fields
+        pre-format and post-format processors for `style` are set under an
+        override key.  The processors are generated once for each distinct
+        style, and the key is reused when the same style is passed again.
 
         Parameters
         ----------
@@ -577,24 +846,118 @@ class StyleFields(object):
             keys when there are conflicts.  If False, treat `style` as a
             standalone style.
         """
+        if style is None:
+            return "default"
+
+        override_keys = self._override_keys
+        try:
+            fingerprint = adopt, elements.fingerprint(style)
+        except TypeError:
+            # There's no way to tell whether this style is the same as one
+            # that has been seen before.
+            fingerprint = None
+        else:
+            key = override_keys.get(fingerprint)
+            if key is not None:
+                override_keys.move_to_end(fingerprint)
+                return key
+
+        if adopt:
+            style = elements.adopt(self.style, style)
+        elements.validate(style)
+
         fields = self.fields
-        if style is not None:
-            if adopt:
-                style = elements.adopt(self.style, style)
-            elements.validate(style)
-
-            for column in self.columns:
-                fields[column].add(
-                    "pre", "override",
-                    *(self.procgen.pre_from_style(style[column])))
-                fields[column].add(
-                    "post", "override",
-                    *(self.procgen.post_from_style(style[column])))
-            return "override"
+        if fingerprint is None:
+            key = "override"
         else:
-            return "default"
+            if len(override_keys) >= self._override_max:
+                _, stale_key = override_keys.popitem(last=False)
+                lgr.debug("Dropping processors for override key %s",
+                          stale_key)
+                for column in self.columns:
+                    fields[column].unregister(stale_key)
+            self._override_count += 1
+            key = "override{}".format(self._override_count)
+            override_keys[fingerprint] = key
+            lgr.debug("Generating processors for override key %s", key)
+
+        for column in self.columns:
+            field = fields[column]
+            field.register(key)
+            field.add("pre", key,
+                      *(self.procgen.pre_from_style(style[column])))
+            field.add("post", key,
+                      *(self.procgen.post_from_style(style[column])))
+        return key
+
+    def _prepare(self, row, style, adopt, can_unhide, measure, count_row):
+        """Set up processors for `row` and, if `measure`, adjust widths.
+
+        Returns
+        -------
+        A tuple with the processor keys to pass to the fields and a flag that
+        indicates whether the field widths required adjustment.
+        """
+        if can_unhide and measure:
+            self.unhide(row)
+
+        group = self._proc_group(style, adopt=adopt)
+        if group != "default":
+            # Override the "default" processor key.
+            proc_keys = ["width", group]
+        else:
+            # Use the set of processors defined by _setup_fields.
+            proc_keys = None
+
+        if measure:
+            adjusted = self._set_widths(row, group, count_row=count_row)
+        else:
+            adjusted = False
+        return proc_keys, adjusted
+
+    def unhide(self, row):
+        """Unhide the "if_missing" columns that have a value in `row`.
+
+        Parameters
+        ----------
+        row : dict
+            A normalized row.
+
+        Returns
+        -------
+        A flag that indicates whether any column was unhidden (bool).
+        """
+        hidden = self.hidden
+        any_unhidden = False
+        for c in row:
+            val = row[c]
+            if hidden[c] == "if_missing" and not isinstance(val, Nothing):
+                lgr.debug("Unhiding column %r after encountering %r",
+                          c, val)
+                hidden[c] = False
+                any_unhidden = True
+        if any_unhidden:
+            self._reset_width_info()
+        return any_unhidden
 
-    def render(self, row, style=None, adopt=True, can_unhide=True):
+    def measure(self, row, style=None, adopt=True, can_unhide=True,
+                cache=None, count_row=False):
+        """Adjust the field widths to `row` without rendering it.
+
+        The parameters are the same as for `render`.
+
+        Returns
+        -------
+        A flag that indicates whether the field widths required adjustment
+        (bool).
+        """
+        if cache is not None and cache.epoch == self._epoch:
+            return False
+        return self._prepare(row, style, adopt, can_unhide, True,
+                             count_row)[1]
+
+    def render(self, row, style=None, adopt=True, can_unhide=True,
+               cache=None, measure=True, count_row=False):
         """Render fields with values from `row`.
 
         Parameters
@@ -611,41 +974,71 @@ class StyleFields(object):
         can_unhide : bool, optional
             Whether a non-missing value within `row` is able to unhide a column
             that is marked with "if_missing".
+        cache : RenderCache, optional
+            If given, reuse the fields rendered by a previous call with the
+            same row and style as long as the field's width is unchanged.  A
+            row that has been rendered before with the current set of visible
+            columns is not considered for width adjustments.
+        measure : bool, optional
+            Whether to consider `row` for width adjustments.  This can be
+            false if the row was already passed to `measure`.
+        count_row : bool, optional
+            Whether `row` counts toward the "freeze" limit of automatically
+            sized columns.  This should be true only when a new row is
+            measured for the first time.
 
         Returns
         -------
         A tuple with the rendered value (str) and a flag that indicates whether
         the field widths required adjustment (bool).
         """
-        hidden = self.hidden
-        any_unhidden = False
-        if can_unhide:
-            for c in row:
-                val = row[c]
-                if hidden[c] == "if_missing" and not isinstance(val, Nothing):
-                    lgr.debug("Unhiding column %r after encountering %r",
-                              c, val)
-                    hidden[c] = False
-                    any_unhidden = True
-        if any_unhidden:
-            self._reset_width_info()
-
-        group = self._proc_group(style, adopt=adopt)
-        if group == "override":
-            # Override the "default" processor key.
-            proc_keys = ["width", "override"]
-        else:
-            # Use the set of processors defined by _setup_fields.
-            proc_keys = None
-
-        adjusted = self._set_widths(row, group)
-        cols = self.visible_columns
-        proc_fields = ((self.fields[c], row[c]) for c in cols)
-        # Exclude fields that weren't able to claim any width to avoid
-        # surrounding empty values with separators.
-        proc_fields = filter(lambda x: x[0].width > 0, proc_fields)
-        proc_fields = (fld(val, keys=proc_keys) for fld, val in proc_fields)
-        return self.style["separator_"].join(proc_fields) + "\n", adjusted
+        if cache is not None:
+            if cache.epoch != self._epoch:
+                cache.clear()
+            elif self._all_cached(cache):
+                return self._join(row, None, cache), False
+
+        if cache is not None and cache.epoch is not None:
+            measure = False
+        proc_keys, adjusted = self._prepare(row, style, adopt, can_unhide,
+                                            measure, count_row)
+        line = self._join(row, proc_keys, cache)
+        if cache is not None:
+            cache.epoch = self._epoch
+        return line, adjusted
+
+    def _all_cached(self, cache):
+        """Whether `cache` has an up-to-date entry for each visible field.
+        """
+        fields = self.fields
+        cached = cache.fields
+        for column in self.visible_columns:
+            width = fields[column].width
+            if width > 0 and cached.get(column, (None,))[0] != width:
+                return False
+        return True
+
+    def _join(self, row, proc_keys, cache=None):
+        fields = self.fields
+        cached = None if cache is None else cache.fields
+        parts = []
+        for column in self.visible_columns:
+            field = fields[column]
+            width = field.width
+            # Exclude fields that weren't able to claim any width to avoid
+            # surrounding empty values with separators.
+            if width <= 0:
+                continue
+            if cached is not None:
+                hit = cached.get(column)
+                if hit is not None and hit[0] == width:
+                    parts.append(hit[1])
+                    continue
+            part = field(row[column], keys=proc_keys)
+            if cached is not None:
+                cached[column] = width, part
+            parts.append(part)
+        return self.style["separator_"].join(parts) + "\n"
 
 
 class RedoContent(Exception):
@@ -669,19 +1062,25 @@ class Content(object):
     Parameters
     ----------
     fields : StyleField instance
+    cache : bool, optional
+        Whether to keep the rendered fields of each row around for reuse (see
+        RenderCache).  This speeds up repeated rendering at the cost of
+        memory.
     """
 
-    def __init__(self, fields):
+    def __init__(self, fields, cache=True):
         self.fields = fields
         self.summary = None
+        self._cache = cache
 
         self.columns = None
         self.ids = None
 
         self._header = None
+        self._has_header = False
         self._rows = []
         self._idkey_to_idx = {}
-        self._idx_to_idkey = {}
+        self._idx_to_idkey = []
 
     def init_columns(self, columns, ids):
         """Set up the fields for `columns`.
@@ -699,7 +1098,7 @@ class Content(object):
         self.ids = ids
 
     def __len__(self):
-        return len(list(self.rows))
+        return len(self._rows) + self._has_header
 
     def __bool__(self):
         return bool(self._rows)
@@ -712,10 +1111,16 @@ class Content(object):
     def rows(self):
         """Data and summary rows.
         """
-        if self._header:
-            yield self._header
-        for i in self._rows:
-            yield i
+        return self._rows_from(0)
+
+    def _rows_from(self, start):
+        """Return an iterable of rows, skipping the first `start` lines.
+        """
+        if self._has_header:
+            if start == 0:
+                return chain([self._header], self._rows)
+            start -= 1
+        return self._rows[start:] if start else self._rows
 
     def _render(self, rows):
         adjusted = []
@@ -729,10 +1134,75 @@ class Content(object):
             raise RedoContent
 
     def __str__(self):
+        return self.render()
+
+    def render(self, start=0):
+        """Render the content lines.
+
+        Parameters
+        ----------
+        start : int, optional
+            Skip this many lines (including the header) at the start.
+
+        Returns
+        -------
+        The rendered lines (str).
+        """
         try:
-            return "".join(self._render(self.rows))
+            return "".join(self._render(self._rows_from(start)))
         except RedoContent:
-            return "".join(self._render(self.rows))
+            return "".join(self._render(self._rows_from(start)))
+
+    def _summary_rows(self):
+        """Return the summary rows to render below the content.
+        """
+        return []
+
+    def render_chunks(self, nlines=1000):
+        """Render the content and summary, yielding chunks of lines.
+
+        Unlike `render`, this doesn't expect the rows to have been rendered
+        before.  All of the rows are measured first, so each row is rendered
+        only once and the widths never need to be readjusted.
+
+        Parameters
+        ----------
+        nlines : int, optional
+            Yield chunks of at most this many lines.
+
+        Returns
+        -------
+        A generator that yields strings.  Nothing, not even a summary, is
+        yielded if there aren't any rows.
+        """
+        if not self:
+            return
+        fields = self.fields
+        if "if_missing" in fields.hidden.values():
+            # Unhide columns before measuring.  Otherwise the rows measured
+            # before the row that unhides a column wouldn't count toward its
+            # width.
+            for row, _ in self._rows:
+                fields.unhide(row)
+        for row, kwds in self._rows:
+            fields.measure(row, count_row=True, **kwds)
+        # Measure the header after the rows in case one of the rows unhid a
+        # column.
+        if self._has_header:
+            fields.measure(self._header.row, **self._header.kwds)
+        summ_rows = self._summary_rows()
+        for row, kwds in summ_rows:
+            fields.measure(row, **kwds)
+
+        chunk = []
+        for row, kwds in chain(self._rows_from(0), summ_rows):
+            line, _ = fields.render(row, measure=False, **kwds)
+            chunk.append(line)
+            if len(chunk) >= nlines:
+                yield "".join(chunk)
+                chunk = []
+        if chunk:
+            yield "".join(chunk)
 
     def get_idkey(self, idx):
         """Return ID keys for a row.
@@ -751,16 +1221,51 @@ class Content(object):
         ------
         IndexError if `idx` does not match known row.
         """
-        if self._header:
+        if self._has_header:
             idx -= 1
             if idx == -1:
                 return None
+        if not 0 <= idx < len(self._idx_to_idkey):
+            msg = ("Index {!r} outside of current range: [0, {})"
+                   .format(idx, len(self._idx_to_idkey)))
+            raise IndexError(msg)
+        return self._idx_to_idkey[idx]
+
+    def store(self, row, style):
+        """Record `row` without rendering it.
+
+        Parameters
+        ----------
+        row, style :
+            See `update`.
+
+        Returns
+        -------
+        A tuple with the stored ContentRow and the index of the row if it
+        was previously seen (or None if it wasn't).
+        """
+        idkey = tuple(row[idx] for idx in self.ids)
+
+        if not self and self.fields.has_header:
+            lgr.debug("Registering header")
+            self._add_header()
+
         try:
-            return self._idx_to_idkey[idx]
+            prev_idx = self._idkey_to_idx[idkey]
         except KeyError:
-            msg = ("Index {!r} outside of current range: [0, {})"
-                   .format(idx, len(self._idkey_to_idx)))
-            raise IndexError(msg) from None
+            prev_idx = None
+        except TypeError:
+            raise ContentError("ID columns must be hashable")
+
+        if prev_idx is not None:
+            lgr.debug("Updating content for row %r", idkey)
+            row_update = {k: v for k, v in row.items()
+                          if not isinstance(v, Nothing)}
+            self._update_row(prev_idx, row_update, style)
+            return self._rows[prev_idx], prev_idx
+        lgr.debug("Adding row %r to content for first time", idkey)
+        self._append_row(idkey, row, style)
+        return self._rows[-1], None
 
     def update(self, row, style):
         """Modify the content.
@@ -786,50 +1291,121 @@ class Content(object):
           * an integer, N: the Nth line of the output needs to be update, and
             the returned content will consist of just this line.
 
-          * repaint: all lines need to be updated, and the returned content
-            will consist of all the lines.
+          * repaint: all lines need to be updated.  The returned content is
+            None, leaving it to the caller to render the lines it needs (e.g.,
+            with `str` or `render`).
         """
         called_before = bool(self)
-        idkey = tuple(row[idx] for idx in self.ids)
-
-        if not called_before and self.fields.has_header:
-            lgr.debug("Registering header")
-            self._add_header()
-            self._rows.append(ContentRow(row, kwds={"style": style}))
-            self._idkey_to_idx[idkey] = 0
-            self._idx_to_idkey[0] = idkey
+        content_row, prev_idx = self.store(row, style)
+        if not called_before and self._has_header:
+            self.fields.measure(content_row.row, count_row=True,
+                                **content_row.kwds)
             return str(self), "append"
 
-        try:
-            prev_idx = self._idkey_to_idx[idkey]
-        except KeyError:
-            prev_idx = None
-        except TypeError:
-            raise ContentError("ID columns must be hashable")
-
-        if prev_idx is not None:
-            lgr.debug("Updating content for row %r", idkey)
-            row_update = {k: v for k, v in row.items()
-                          if not isinstance(v, Nothing)}
-            self._rows[prev_idx].row.update(row_update)
-            self._rows[prev_idx].kwds.update({"style": style})
-            # Replace the passed-in row since it may not have all the columns.
-            row = self._rows[prev_idx][0]
-        else:
-            lgr.debug("Adding row %r to content for first time", idkey)
-            nrows = len(self._rows)
-            self._idkey_to_idx[idkey] = nrows
-            self._idx_to_idkey[nrows] = idkey
-            self._rows.append(ContentRow(row, kwds={"style": style}))
-
-        line, adjusted = self.fields.render(row, style)
+        # Use the stored row since the passed-in row may not have all the
+        # columns.
+        line, adjusted = self.fields.render(content_row.row,
+                                            count_row=prev_idx is None,
+                                            **content_row.kwds)
         lgr.log(9, "Rendered line as %r", line)
         if called_before and adjusted:
-            return str(self), "repaint"
+            if self._has_header:
+                # The repaint is left to the caller, but make sure the header
+                # has a say in the widths (e.g., for a column that was just
+                # unhidden) before anything else, such as a summary, is
+                # rendered.  The other rows were measured as they came in.
+                self.fields.render(self._header.row, **self._header.kwds)
+            return None, "repaint"
         if not adjusted and prev_idx is not None:
             return line, prev_idx + self.fields.has_header
         return line, "append"
 
+    def extend(self, rows):
+        """Modify the content with several rows at once.
+
+        Unlike calling `update` for each row, this renders each affected row
+        only once, after all of the rows have been registered.
+
+        Parameters
+        ----------
+        rows : iterable of (row, style) tuples
+            See `update`.
+
+        Returns
+        -------
+        A tuple with a flag that indicates whether the field widths required
+        adjustment (in which case all lines need to be written) and a sorted
+        list of the indices of the lines (including the header) that were
+        added or updated.
+        """
+        was_empty = not self
+        touched = {}
+        added = set()
+        for row, style in rows:
+            content_row, idx = self.store(row, style)
+            if idx is None:
+                idx = len(self._rows) - 1
+                added.add(idx)
+            touched[idx] = content_row
+        if not touched:
+            return False, []
+
+        fields = self.fields
+        adjusted = False
+        for idx in sorted(touched):
+            content_row = touched[idx]
+            _, adj = fields.render(content_row.row, count_row=idx in added,
+                                   **content_row.kwds)
+            adjusted = adjusted or adj
+        if self._has_header:
+            # Render the header last so that it takes any columns unhidden by
+            # the rows into account.
+            _, adj = fields.render(self._header.row, **self._header.kwds)
+            adjusted = adjusted or adj
+        offset = int(self._has_header)
+        lines = [idx + offset for idx in sorted(touched)]
+        if was_empty and self._has_header:
+            lines.insert(0, 0)
+        return adjusted, lines
+
+    def render_lines(self, idxs):
+        """Render the lines at `idxs`.
+
+        Parameters
+        ----------
+        idxs : iterable of int
+            Line indices, where the header (if any) is the first line.
+
+        Returns
+        -------
+        The rendered lines (str).
+        """
+        offset = int(self._has_header)
+        rows = (self._header if offset and idx == 0
+                else self._rows[idx - offset]
+                for idx in idxs)
+        return "".join(self._render(rows))
+
+    def _append_row(self, idkey, row, style):
+        """Register `row` as a new entry under `idkey`.
+        """
+        self._idkey_to_idx[idkey] = len(self._rows)
+        self._idx_to_idkey.append(idkey)
+        self._rows.append(
+            ContentRow(row, kwds={"style": style, "cache": self._new_cache()}))
+
+    def _update_row(self, idx, row_update, style):
+        """Merge `row_update` into the existing entry at `idx`.
+        """
+        self._rows[idx].row.update(row_update)
+        kwds = self._rows[idx].kwds
+        kwds["style"] = style
+        if kwds["cache"] is not None:
+            kwds["cache"].clear()
+
+    def _new_cache(self):
+        return RenderCache() if self._cache else None
+
     def _add_header(self):
         if isinstance(self.columns, OrderedDict):
             row = self.columns
@@ -838,28 +1414,68 @@ class Content(object):
         self._header = ContentRow(row,
                                   kwds={"style": self.fields.style["header_"],
                                         "can_unhide": False,
-                                        "adopt": False})
+                                        "adopt": False,
+                                        "cache": self._new_cache()})
+        self._has_header = True
 
 
 class ContentWithSummary(Content):
     """Like Content, but append a summary to the return value of `update`.
     """
 
-    def __init__(self, fields):
-        super(ContentWithSummary, self).__init__(fields)
+    def __init__(self, fields, cache=True):
+        super(ContentWithSummary, self).__init__(fields, cache=cache)
         self.summary = None
 
     def init_columns(self, columns, ids):
         super(ContentWithSummary, self).init_columns(columns, ids)
         self.summary = Summary(self.fields.style)
 
+    def _append_row(self, idkey, row, style):
+        super(ContentWithSummary, self)._append_row(idkey, row, style)
+        if self.summary:
+            self.summary.add(row)
+
+    def _update_row(self, idx, row_update, style):
+        if not self.summary:
+            super(ContentWithSummary, self)._update_row(idx, row_update, style)
+            return
+        row = self._rows[idx].row
+        self.summary.remove(row)
+        super(ContentWithSummary, self)._update_row(idx, row_update, style)
+        self.summary.add(row)
+
+    def _summary_rows(self):
+        if not self.summary:
+            return []
+        # Only consumed if there are aggregates that aren't incremental.
+        return self.summary.summarize(self.fields.visible_columns,
+                                      (r.row for r in self._rows))
+
+    def extend(self, rows):
+        """Like `Content.extend`, but also return the summary.
+
+        Returns
+        -------
+        A tuple with the adjustment flag, the touched lines, and the rendered
+        summary (or None if there is no summary).
+        """
+        adjusted, lines = super(ContentWithSummary, self).extend(rows)
+        if not self.summary:
+            return adjusted, lines, None
+        summ_rows = self._summary_rows()
+        try:
+            summ_content = "".join(self._render(summ_rows))
+        except RedoContent:
+            adjusted = True
+            summ_content = "".join(self._render(summ_rows))
+        return adjusted, lines, summ_content
+
     def update(self, row, style):
         lgr.log(9, "Updating with .summary set to %s", self.summary)
         content, status = super(ContentWithSummary, self).update(row, style)
         if self.summary:
-            summ_rows = self.summary.summarize(
-                self.fields.visible_columns,
-                [r.row for r in self._rows])
+            summ_rows = self._summary_rows()
 
             def join():
                 return "".join(self._render(summ_rows))
@@ -869,6 +1485,103 @@ class ContentWithSummary(Content):
             except RedoContent:
                 # If rendering the summary lines triggered an adjustment, we
                 # need to re-render the main content as well.
-                return str(self), "repaint", join()
+                return None, "repaint", join()
             return content, status, summ_content
         return content, status, None
+
+
+class LogContent(Content):
+    """Content that renders rows as they come in and then forgets them.
+
+    The column widths are inferred from the first rows and then held fixed,
+    so memory use doesn't grow with the number of rows.  Until the widths are
+    settled, rows are held back (and updates to them are merged).  After that,
+    each row, including an update to a previously seen row, is rendered as a
+    new line.  Values that don't fit within the inferred widths are
+    truncated, and columns hidden with "if_missing" remain hidden.  Columns
+    that are absent from a row (e.g., the columns that weren't part of an
+    asynchronous update) are displayed as missing.
+
+    Parameters
+    ----------
+    fields : StyleField instance
+    sample : int, optional
+        Infer the column widths from this many rows.  If none of the visible
+        columns have an automatic width, the rows are rendered right away.
+    """
+
+    def __init__(self, fields, sample=100):
+        super(LogContent, self).__init__(fields, cache=False)
+        self.sample = sample
+        self._sampling = True
+        self._nothings = None  # column => missing value
+
+    def init_columns(self, columns, ids):
+        super(LogContent, self).init_columns(columns, ids)
+        fields = self.fields
+        style = fields.style
+        self._nothings = {
+            c: Nothing(style[c]["missing"]) if "missing" in style[c]
+            else NOTHING
+            for c in columns}
+        if not (fields.autowidth_columns
+                or "if_missing" in fields.hidden.values()):
+            lgr.debug("No automatic widths; skipping sample")
+            self.sample = 0
+
+    def update(self, row, style):
+        """Register `row`.
+
+        Parameters
+        ----------
+        row : dict
+            A normalized row.
+        style :
+            Passed to `StyleFields.render`.
+
+        Returns
+        -------
+        The lines to write (str).  This is empty if the row is held back while
+        the widths are inferred.
+        """
+        if self._sampling:
+            self.store(row, style)
+            if len(self._rows) < self.sample:
+                return ""
+            return self.finish()
+        if len(row) < len(self._nothings):
+            filled = dict(self._nothings)
+            filled.update(row)
+            row = filled
+        line, _ = self.fields.render(row, style=style, measure=False)
+        return line
+
+    def extend(self, rows):
+        """Register each (row, style) tuple in `rows`.
+
+        Returns
+        -------
+        The lines to write (str).
+        """
+        return "".join(self.update(row, style) for row, style in rows)
+
+    def finish(self):
+        """Render any rows that have been held back.
+
+        After this is called, the widths are fixed.
+
+        Returns
+        -------
+        The lines to write (str).
+        """
+        if not self._sampling:
+            return ""
+        lgr.debug("Settling widths after %d row(s)", len(self._rows))
+        self._sampling = False
+        content = "".join(self.render_chunks())
+        self._header = None
+        self._has_header = False
+        self._rows = []
+        self._idkey_to_idx = {}
+        self._idx_to_idkey = []
+        return content
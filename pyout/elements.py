@@ -1,6 +1,7 @@
 """Style elements and schema validation.
 """
 
+from collections import OrderedDict
 from collections.abc import Mapping
 import jsonschema
 
@@ -76,7 +77,16 @@ schema = {
             column claiming _one_ character of available width at a time until
             a column is at its maximum width or there is no available width
             left.  Setting a column's weight to an integer N makes it claim N
-            characters each iteration.""",
+            characters each iteration.
+
+            Every time an automatically sized column grows, the table is
+            redrawn.  For values that grow steadily (e.g., counters), the
+            following keys trade some whitespace for fewer redraws: 'grow'
+            makes the column grow by at least this fraction of its current
+            width (e.g., 0.5 for 50%), 'round' rounds a grown width up to a
+            multiple of the given integer, and 'freeze' stops the column from
+            growing after widths have been adjusted for the given number of
+            rows.""",
             "oneOf": [{"$ref": "#/definitions/width_type"},
                       {"type": "string",
                        "enum": ["auto"]},
@@ -86,6 +96,9 @@ schema = {
                            "min": {"$ref": "#/definitions/width_type"},
                            "width": {"$ref": "#/definitions/width_type"},
                            "weight": {"type": "integer", "minimum": 1},
+                           "grow": {"type": "number", "exclusiveMinimum": 0},
+                           "round": {"type": "integer", "minimum": 1},
+                           "freeze": {"type": "integer", "minimum": 1},
                            "marker": {"type": ["string", "boolean"]},
                            "truncate": {"type": "string",
                                         "enum": ["left",
@@ -98,7 +111,12 @@ schema = {
         "aggregate": {
             "description": """A function that produces a summary value.  This
             function will be called with all of the column's (unprocessed)
-            field values and should return a single value to be displayed.""",
+            field values and should return a single value to be displayed.
+
+            Instead of a function, an instance of pyout.summary.Aggregate
+            (e.g., pyout.summary.Sum()) can be given.  Its summary is updated
+            incrementally as rows are added or updated rather than recomputed
+            from all of the column's values.""",
             "scope": "column"},
         "delayed": {
             "description": """Don't wait for this column's value.
@@ -109,6 +127,31 @@ schema = {
             in its own callable (i.e. independently of other columns).""",
             "type": ["boolean", "string"],
             "scope": "field"},
+        "executor": {
+            "description": """Where to run this column's producers.
+            By default, producers (i.e. callables and generators given as
+            values, including delayed accessors) are run in a thread pool.
+            With "process", they are run in a process pool instead, which
+            avoids contention for the global interpreter lock between
+            CPU-bound producers.  These producers and their results must be
+            picklable, so this can't be combined with "delayed".  The items
+            that a generator function yields are written as they are
+            produced.  Generator objects can't be sent to another process and
+            are still run in a thread.""",
+            "type": "string",
+            "enum": ["process", "thread"],
+            "default": "thread",
+            "scope": "column"},
+        "memoize": {
+            "description": """Cache the results of the transform function.
+            Results are stored by the (unprocessed) field value, so the
+            transform is called once for each distinct value rather than each
+            time the field is measured or rendered.  Values that aren't
+            hashable are not cached.  True caches the results for the 128 most
+            recently used values.  An integer sets a different limit.""",
+            "type": ["boolean", "integer"],
+            "minimum": 1,
+            "scope": "field"},
         "missing": {
             "description": "Text to display for missing values",
             "type": "string",
@@ -129,7 +172,7 @@ schema = {
             This function will be called with the (unprocessed) field value as
             the single argument and should return a transformed value.  Note:
             This function should not have side-effects because it may be called
-            multiple times.""",
+            multiple times.  See also "memoize".""",
             "scope": "field"},
         # Complete list of column style elements
         "styles": {
@@ -139,7 +182,9 @@ schema = {
                            "bold": {"$ref": "#/definitions/bold"},
                            "color": {"$ref": "#/definitions/color"},
                            "delayed": {"$ref": "#/definitions/delayed"},
+                           "executor": {"$ref": "#/definitions/executor"},
                            "hide": {"$ref": "#/definitions/hide"},
+                           "memoize": {"$ref": "#/definitions/memoize"},
                            "missing": {"$ref": "#/definitions/missing"},
                            "re_flags": {"$ref": "#/definitions/re_flags"},
                            "transform": {"$ref": "#/definitions/transform"},
@@ -270,9 +315,51 @@ class StyleValidationError(StyleError):
         super(StyleValidationError, self).__init__(msg)
 
 
+_validator = None
+
+
+def _get_validator():
+    """Return a validator for `schema`, building it on the first call.
+    """
+    global _validator
+    if _validator is None:
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        _validator = cls(schema)
+    return _validator
+
+
+def fingerprint(value):
+    """Return a hashable representation of the structure of `value`.
+
+    The type is recorded along with each value so that, for example, True and
+    1 or a list and a tuple (which validate differently) are distinguished.
+
+    Raises
+    ------
+    TypeError if `value` contains an unhashable item that isn't a mapping or
+    a list/tuple.
+    """
+    if isinstance(value, Mapping):
+        items = tuple(sorted((k, fingerprint(v)) for k, v in value.items()))
+        return type(value), items
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(fingerprint(v) for v in value)
+    hash(value)
+    return type(value), value
+
+
+# Fingerprints of styles that have passed validation, oldest first.
+_validated = OrderedDict()
+_validated_max = 256
+
+
 def validate(style):
     """Check `style` against pyout.styling.schema.
 
+    Styles that have already passed validation are remembered, so validating
+    the same style again is cheap.
+
     Parameters
     ----------
     style : dict
@@ -283,14 +370,26 @@ def validate(style):
     StyleValidationError if `style` is not valid.
     """
     try:
-        jsonschema.validate(style, schema)
-    except jsonschema.ValidationError as exc:
-        new_exc = StyleValidationError(exc)
+        key = fingerprint(style)
+    except TypeError:
+        key = None
+    if key is not None and key in _validated:
+        return
+
+    error = jsonschema.exceptions.best_match(
+        _get_validator().iter_errors(style))
+    if error is not None:
+        new_exc = StyleValidationError(error)
         # Don't dump the original jsonschema exception because it is already
         # included in the StyleValidationError's message.
         new_exc.__cause__ = None
         raise new_exc
 
+    if key is not None:
+        if len(_validated) >= _validated_max:
+            _validated.popitem(last=False)
+        _validated[key] = True
+
 
 def value_type(value):
     """Classify `value` of bold, color, and underline keys.
@@ -1,13 +1,17 @@
 """Define a "field" based on a sequence of processor functions.
 """
 
+from bisect import bisect_right
 from collections import defaultdict
 from collections import OrderedDict
+from functools import lru_cache
+from functools import wraps
 from itertools import chain
 from logging import getLogger
 import re
 import sys
 
+from pyout import elements
 from pyout.elements import value_type
 
 lgr = getLogger(__name__)
@@ -72,6 +76,8 @@ class Field(object):
 
         self.pre = defaultdict(list)
         self.post = defaultdict(list)
+        # (keys, exclude_post) => compiled processor pipeline
+        self._compiled = {}
 
     def _check_if_registered(self, key):
         if key not in self.registered_keys:
@@ -101,6 +107,40 @@ class Field(object):
             raise ValueError("kind is not 'pre' or 'post'")
         self._check_if_registered(key)
         procs[key] = values
+        self._uncompile(key)
+
+    def register(self, key):
+        """Make `key` available as a processor key.
+
+        Parameters
+        ----------
+        key : str
+        """
+        self.registered_keys.add(key)
+
+    def unregister(self, key):
+        """Remove `key` and its processors.
+
+        Parameters
+        ----------
+        key : str
+            A registered key that isn't one of the default keys.
+        """
+        if key in self.default_keys:
+            raise ValueError("Cannot unregister default key '{}'".format(key))
+        self.registered_keys.discard(key)
+        self.pre.pop(key, None)
+        self.post.pop(key, None)
+        self._uncompile(key)
+
+    def _uncompile(self, key):
+        """Drop the compiled pipelines that involve `key`.
+        """
+        default_keys = self.default_keys
+        stale = [ck for ck in self._compiled
+                 if key in (default_keys if ck[0] is None else ck[0])]
+        for cache_key in stale:
+            del self._compiled[cache_key]
 
     @property
     def width(self):
@@ -110,16 +150,12 @@ class Field(object):
     def width(self, value):
         self._width = value
         self._fmt = self._build_format()
+        self._compiled.clear()
 
     def _build_format(self):
         align = self._align_values[self._align]
         return "".join(["{:", align, str(self.width), "}"])
 
-    def _format(self, _, result):
-        """Wrap format call as a two-argument processor function.
-        """
-        return self._fmt.format(str(result))
-
     def __call__(self, value, keys=None, exclude_post=False):
         """Render `value` by feeding it through the processors.
 
@@ -134,26 +170,42 @@ class Field(object):
             Whether to return the vaue after the format step rather than
             feeding it through post-format processors.
         """
-        lgr.debug("Rendering field with value %r and %s keys %r",
-                  value,
-                  "default" if keys is None else "non-default",
-                  self.default_keys)
-        if keys is None:
-            keys = self.default_keys
+        cache_key = None if keys is None else tuple(keys), exclude_post
+        try:
+            render = self._compiled[cache_key]
+        except KeyError:
+            render = self._compiled[cache_key] = self._compile(
+                self.default_keys if keys is None else keys,
+                exclude_post)
+        return render(value)
+
+    def _compile(self, keys, exclude_post):
+        """Build a function that feeds a value through the processors.
+
+        The result is cached by __call__ until the processors or width
+        change.
+        """
+        lgr.debug("Compiling processors for keys %r (exclude_post=%s)",
+                  keys, exclude_post)
         for key in keys:
             self._check_if_registered(key)
 
-        pre_funcs = chain(*(self.pre[k] for k in keys))
+        pre_funcs = list(chain(*(self.pre[k] for k in keys)))
         if exclude_post:
             post_funcs = []
         else:
-            post_funcs = chain(*(self.post[k] for k in keys))
-
-        funcs = chain(pre_funcs, [self._format], post_funcs)
-        result = value
-        for fn in funcs:
-            result = fn(value, result)
-        return result
+            post_funcs = list(chain(*(self.post[k] for k in keys)))
+        fmt = self._fmt.format
+
+        def render(value):
+            result = value
+            for fn in pre_funcs:
+                result = fn(value, result)
+            result = fmt(str(result))
+            for fn in post_funcs:
+                result = fn(value, result)
+            return result
+        return render
 
 
 class Nothing(object):
@@ -238,6 +290,33 @@ class StyleProcessors(object):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def memoize(function, maxsize):
+        """Wrap `function` to cache its results for hashable arguments.
+
+        Parameters
+        ----------
+        function : callable
+            A function that takes a single argument.
+        maxsize : int
+            Keep the results for this many of the most recently used
+            arguments.
+
+        Returns
+        -------
+        A callable.
+        """
+        cached = lru_cache(maxsize=maxsize, typed=True)(function)
+
+        @wraps(function)
+        def memoized(value):
+            try:
+                hash(value)
+            except TypeError:
+                return function(value)
+            return cached(value)
+        return memoized
+
     @staticmethod
     def transform(function):
         """Return a processor for a style's "transform" function.
@@ -343,12 +422,16 @@ class StyleProcessors(object):
         style_attr = style_key if self.style_types[style_key] is bool else None
         regexps = [(re.compile(r, flags=re_flags), v)
                    for r, v in style_value["re_lookup"]]
+        combined = self._combine_regexps([r for r, _ in regexps], re_flags)
 
         def proc(value, result):
             if not isinstance(value, str):
                 lgr.debug("by_re_lookup: Skipping non-string value %r",
                           value)
                 return result
+            if combined is not None and not combined.search(value):
+                # None of the regular expressions match.
+                return result
             for r, lookup_value in regexps:
                 if r.search(value):
                     if not lookup_value:
@@ -357,6 +440,40 @@ class StyleProcessors(object):
             return result
         return proc
 
+    @staticmethod
+    def _combine_regexps(regexps, re_flags):
+        """Combine `regexps` into a single alternation.
+
+        Searching with the combined expression finds a match if and only if
+        one of `regexps` would.  It's a cheap way to rule out values that
+        don't match any of them, but it can't tell which one matches first.
+
+        Parameters
+        ----------
+        regexps : list of compiled regular expressions
+        re_flags : int
+
+        Returns
+        -------
+        A compiled regular expression or None if the expressions can't be
+        combined (e.g., because they contain groups that could conflict or
+        inline global flags that would apply to all of them).
+        """
+        if len(regexps) < 2 or any(r.groups for r in regexps):
+            return None
+        # Before Python 3.11, a global flag like "(?i)" in the middle of a
+        # pattern applies to the whole pattern rather than raising an error.
+        flags = re.compile("", flags=re_flags).flags
+        if any(r.flags != flags for r in regexps):
+            return None
+        try:
+            return re.compile(
+                "|".join("(?:{})".format(r.pattern) for r in regexps),
+                flags=re_flags)
+        except re.error as exc:
+            lgr.debug("Not combining regular expressions: %s", exc)
+            return None
+
     def by_interval_lookup(self, style_key, style_value):
         """Return a processor for an "interval" style value.
 
@@ -377,7 +494,9 @@ class StyleProcessors(object):
         A function.
         """
         style_attr = style_key if self.style_types[style_key] is bool else None
-        intervals = style_value["interval"]
+        bounds, lookup_values = self._segment_intervals(
+            style_value["interval"])
+        inf = float("inf")
 
         def proc(value, result):
             try:
@@ -385,20 +504,51 @@ class StyleProcessors(object):
             except Exception as exc:
                 lgr.debug("by_interval_lookup: Skipping %r: %s", value, exc)
                 return result
+            if not value < inf:
+                # Neither NaN nor infinity is within any interval.
+                return result
 
-            for start, end, lookup_value in intervals:
-                if start is None:
-                    start = float("-inf")
-                if end is None:
-                    end = float("inf")
-
-                if start <= value < end:
-                    if not lookup_value:
-                        return result
-                    return self.render(style_attr or lookup_value, result)
-            return result
+            lookup_value = lookup_values[bisect_right(bounds, value)]
+            if not lookup_value:
+                return result
+            return self.render(style_attr or lookup_value, result)
         return proc
 
+    @staticmethod
+    def _segment_intervals(intervals):
+        """Split the number line at the bounds of `intervals`.
+
+        Parameters
+        ----------
+        intervals : list of (start, end, lookup_value) tuples
+            See `by_interval_lookup`.
+
+        Returns
+        -------
+        A tuple (bounds, lookup_values), where `bounds` is a sorted list of the
+        distinct interval bounds and `lookup_values` has one more item than
+        `bounds`.  For a value x, the item of `lookup_values` at
+        `bisect_right(bounds, x)` is the lookup value of the first interval
+        in `intervals` that contains x (or None if no interval contains x).
+        """
+        ninf, inf = float("-inf"), float("inf")
+        intervals = [(ninf if start is None else start,
+                      inf if end is None else end,
+                      lookup_value)
+                     for start, end, lookup_value in intervals]
+        bounds = sorted({b for start, end, _ in intervals
+                         for b in (start, end) if ninf < b < inf})
+        lookup_values = []
+        for lo, hi in zip([ninf] + bounds, bounds + [inf]):
+            for start, end, lookup_value in intervals:
+                # Each segment lies entirely within or outside an interval.
+                if start <= lo and hi <= end:
+                    lookup_values.append(lookup_value)
+                    break
+            else:
+                lookup_values.append(None)
+        return bounds, lookup_values
+
     def pre_from_style(self, column_style):
         """Yield pre-format processors based on `column_style`.
 
@@ -413,8 +563,12 @@ class StyleProcessors(object):
         A generator object.
         """
         if "transform" in column_style:
-            yield _pass_nothing_through(
-                self.transform(column_style["transform"]))
+            function = column_style["transform"]
+            memoize = column_style.get("memoize")
+            if memoize:
+                function = self.memoize(
+                    function, 128 if memoize is True else memoize)
+            yield _pass_nothing_through(self.transform(function))
 
     def post_from_style(self, column_style):
         """Yield post-format processors based on `column_style`.
@@ -429,14 +583,12 @@ class StyleProcessors(object):
         -------
         A generator object.
         """
-        flanks = Flanks()
-        yield flanks.split_flanks
-
         fns = {"simple": self.by_key,
                "lookup": self.by_lookup,
                "re_lookup": self.by_re_lookup,
                "interval": self.by_interval_lookup}
 
+        procs = []
         for key in self.style_types:
             if key not in column_style:
                 continue
@@ -447,8 +599,16 @@ class StyleProcessors(object):
             if vtype == "re_lookup":
                 args.append(sum(getattr(re, f)
                                 for f in column_style.get("re_flags", [])))
-            yield _pass_nothing_through(fn(*args))
+            procs.append(_pass_nothing_through(fn(*args)))
 
+        if not procs:
+            # Without any styling, there's no need to split and rejoin the
+            # flanking whitespace.
+            return
+
+        flanks = Flanks()
+        yield flanks.split_flanks
+        yield from procs
         yield flanks.join_flanks
 
 
@@ -460,18 +620,24 @@ class Flanks(object):
 
     def __init__(self):
         self.left, self.right = None, None
+        # The value returned by the last `split_flanks` call.  Processors
+        # that run between the split and the join can compare their result to
+        # this to see whether anything was changed.
+        self.stripped = None
 
     def split_flanks(self, _, result):
         """Return `result` without flanking whitespace.
         """
         if not result.strip():
             self.left, self.right = "", ""
+            self.stripped = result
             return result
 
         match = self.flank_re.match(result)
         assert match, "This regexp should always match"
         self.left, self.right = match.group(1), match.group(3)
-        return match.group(2)
+        self.stripped = stripped = match.group(2)
+        return stripped
 
     def join_flanks(self, _, result):
         """Add whitespace from last `split_flanks` call back to `result`.
@@ -496,6 +662,20 @@ class TermProcessors(StyleProcessors):
 
     def __init__(self, term):
         self.term = term
+        # Resolve the codes up front rather than going through the terminal's
+        # capability lookup each time a value is rendered.
+        colors = elements.schema["definitions"]["color"]["oneOf"][0]["enum"]
+        self._codes = {attr: str(getattr(term, attr))
+                       for attr in chain(["bold", "underline"], colors)}
+        self._normal = str(term.normal)
+
+    def _code(self, style_attr):
+        try:
+            return self._codes[style_attr]
+        except KeyError:
+            code = str(getattr(self.term, style_attr))
+            self._codes[style_attr] = code
+            return code
 
     def render(self, style_attr, value):
         """Prepend terminal code for `key` to `value`.
@@ -512,16 +692,20 @@ class TermProcessors(StyleProcessors):
         The code for `key` (e.g., "\x1b[1m" for bold) plus the
         original value.
         """
-        if not value.strip():
+        if not value or value.isspace():
             # We've got an empty string.  Don't bother adding any
             # codes.
             return value
-        return str(getattr(self.term, style_attr)) + value
+        return self._code(style_attr) + value
+
+    def _maybe_reset(self, flanks):
+        normal = self._normal
 
-    def _maybe_reset(self):
         def proc(_, result):
-            if "\x1b" in result:
-                return result + self.term.normal
+            # Codes are only ever prepended, so the result is a new string if
+            # and only if a code was applied since the flanks were split.
+            if result is not flanks.stripped:
+                return result + normal
             return result
         return proc
 
@@ -531,5 +715,5 @@ class TermProcessors(StyleProcessors):
         for proc in super(TermProcessors, self).post_from_style(column_style):
             if proc.__name__ == "join_flanks":
                 # Reset any codes before adding back whitespace.
-                yield self._maybe_reset()
+                yield self._maybe_reset(proc.__self__)
             yield proc
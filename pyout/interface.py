@@ -2,29 +2,48 @@
 """
 
 import abc
-from collections import defaultdict
+import asyncio
 from collections import OrderedDict
 from collections.abc import Mapping
 import concurrent.futures as cfut
 from concurrent.futures import ThreadPoolExecutor as Pool
 from contextlib import contextmanager
+from functools import partial
 from functools import wraps
 import inspect
 from itertools import chain
 from logging import getLogger
+import multiprocessing
 import os
+import queue
 import sys
 import threading
 import time
 
+from pyout.common import ContentError
 from pyout.common import ContentWithSummary
+from pyout.common import LogContent
 from pyout.common import RowNormalizer
 from pyout.common import StyleFields
+from pyout.field import Nothing
 from pyout.field import PlainProcessors
 
 lgr = getLogger(__name__)
 
 
+def _put_generated(genfn, items):
+    """Put each item yielded by `genfn()` on the `items` queue.
+
+    This is run in a worker process.  Each item is sent as a (False, item)
+    tuple, followed by (True, None) once the generator is done.
+    """
+    try:
+        for item in genfn():
+            items.put((False, item))
+    finally:
+        items.put((True, None))
+
+
 class Stream(object, metaclass=abc.ABCMeta):
     """Output stream interface used by Writer.
 
@@ -82,6 +101,101 @@ class Stream(object, metaclass=abc.ABCMeta):
         """
 
 
+class FrameRenderer(object):
+    """Collect row writes and pass them on at a limited rate.
+
+    Rows are submitted with an ID key.  Repeated submissions for the same ID
+    key before the next frame are merged, and a background thread hands the
+    pending rows to `write_fn` once per frame.
+
+    Parameters
+    ----------
+    write_fn : callable
+        Called with a list of (row, style) tuples for each frame.
+    refresh_hz : int or float
+        Maximum number of frames per second.
+    """
+
+    def __init__(self, write_fn, refresh_hz):
+        self._write_fn = write_fn
+        self.interval = 1 / refresh_hz
+
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._thread = None
+        self._stop_event = None
+        self._exc = None
+
+    def _raise_if_failed(self):
+        exc, self._exc = self._exc, None
+        if exc is not None:
+            raise exc
+
+    def submit(self, idkey, row, style):
+        """Schedule `row` to be written in the next frame.
+
+        Parameters
+        ----------
+        idkey : tuple
+            ID key of `row`.
+        row : dict
+            A normalized row.  If a row with the same ID key is already
+            pending, the non-missing values of `row` are merged into it.
+        style : dict or None
+            Style for the row.  This replaces the style of a pending row.
+        """
+        self._raise_if_failed()
+        with self._lock:
+            try:
+                prev = self._pending.get(idkey)
+            except TypeError:
+                raise ContentError("ID columns must be hashable") from None
+            if prev is not None:
+                prev_row = prev[0]
+                prev_row.update({k: v for k, v in row.items()
+                                 if not isinstance(v, Nothing)})
+                row = prev_row
+            self._pending[idkey] = row, style
+            if self._thread is None:
+                self._start()
+
+    def _start(self):
+        lgr.debug("Starting renderer thread with interval %s", self.interval)
+        self._stop_event = stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(stop_event,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self, stop_event):
+        while not stop_event.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as exc:
+                lgr.debug("Renderer failed: %s", exc)
+                self._exc = exc
+                return
+
+    def flush(self):
+        """Write all pending rows.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, OrderedDict()
+        if pending:
+            lgr.debug("Writing frame with %d row(s)", len(pending))
+            self._write_fn(list(pending.values()))
+
+    def stop(self):
+        """Stop the background thread and write any pending rows.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop_event.set()
+            thread.join()
+        self._raise_if_failed()
+        self.flush()
+
+
 def skip_if_aborted(method):
     """Decorate Writer `method` to prevent execution if write has been aborted.
     """
@@ -103,7 +217,9 @@ class Writer(object):
     """
     def __init__(self, columns=None, style=None, stream=None,
                  interactive=None, mode=None, continue_on_failure=True,
-                 wait_for_top=3, max_workers=None):
+                 wait_for_top=3, max_workers=None, *, wait_for_top_delay=0.5,
+                 max_pending=None, executor=None, refresh_hz=None,
+                 repaint="all", log_sample=100):
         self._columns = columns
         self._ids = None
 
@@ -112,20 +228,55 @@ class Writer(object):
         self._normalizer = None
 
         self._pool = None
+        # Process pool (and the manager for its queues) for producers of
+        # columns with an "executor" style of "process".
+        self._process_pool = None
+        self._manager = None
+        # Set to stop the threads that read the items of generators running
+        # in the process pool.
+        self._stop_reading = threading.Event()
+        # An executor given by the caller.  Unlike a pool created by the
+        # instance, it isn't shut down.
+        self._executor = executor
         if max_workers is None and sys.version_info < (3, 8):
             # ThreadPoolExecutor's max_workers didn't get a default until
             # Python 3.5, and that default was changed in 3.8.  Use Python
             # 3.8's default for consistent behavior.
             max_workers = min(32, (os.cpu_count() or 1) + 4)
         self._max_workers = max_workers
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("max_pending must be at least 1: {!r}"
+                             .format(max_pending))
+        self._max_pending = max_pending
         self._lock = None
         self._aborted = False
-        self._futures = defaultdict(list)
+        # Bookkeeping for the futures of asynchronous workers.  Futures are
+        # dropped as they finish, except for failed ones.
+        self._futures_lock = threading.Lock()
+        self._futures = {}  # id key => set of outstanding futures
+        self._pending = {}  # outstanding future => id key
+        self._failed = OrderedDict()  # failed future => id key
         self._continue_on_failure = continue_on_failure
 
         self._wait_for_top = wait_for_top
+        self._wait_for_top_delay = wait_for_top_delay
+        # Notified whenever an asynchronous worker finishes.
+        self._done_cond = threading.Condition()
         self._mode = mode
         self._write_fn = None
+        self._write_many_fn = None
+        self._refresh_hz = refresh_hz
+        self._renderer = None
+
+        valid_repaint = {"all", "visible", "visible_then_all"}
+        if repaint not in valid_repaint:
+            raise ValueError("{!r} is not a valid repaint value: {!r}"
+                             .format(repaint, valid_repaint))
+        self._repaint = repaint
+        self._log_sample = log_sample
+        # Whether off-screen lines are out of date because of a "visible"
+        # repaint.
+        self._offscreen_stale = False
 
         self._stream = None
         self._content = None
@@ -152,8 +303,14 @@ class Writer(object):
             lgr.debug("Setting width to stream width: %s",
                       self._stream.width)
             style["width_"] = self._stream.width
-        self._content = ContentWithSummary(
-            StyleFields(style, processors or PlainProcessors()))
+        fields = StyleFields(style, processors or PlainProcessors())
+        if self._mode == "log":
+            self._content = LogContent(fields, sample=self._log_sample)
+        else:
+            # Rows are rendered only once in final mode, so there's no point
+            # in holding on to the rendered fields.
+            self._content = ContentWithSummary(
+                fields, cache=self._mode != "final")
 
     def _init_prewrite(self):
         self._content.init_columns(self._columns, self.ids)
@@ -171,7 +328,7 @@ class Writer(object):
                     value = "incremental"
             else:
                 value = "final"
-        valid = {"update", "incremental", "final"}
+        valid = {"update", "incremental", "final", "log"}
         if value not in valid:
             raise ValueError("{!r} is not a valid mode: {!r}"
                              .format(value, valid))
@@ -180,15 +337,28 @@ class Writer(object):
         self._mode = value
         if value == "incremental":
             self._write_fn = self._write_incremental
+            self._write_many_fn = self._write_incremental_many
         elif value == "final":
             self._write_fn = self._write_final
+            self._write_many_fn = self._write_final_many
+        elif value == "log":
+            self._write_fn = self._write_log
+            self._write_many_fn = self._write_log_many
         else:
             if self._stream.supports_updates and self._stream.interactive:
                 self._write_fn = self._write_update
+                self._write_many_fn = self._write_update_many
             else:
                 raise ValueError("Stream {} does not support updates"
                                  .format(self._stream))
 
+        if self._refresh_hz and value != "final":
+            lgr.debug("Limiting writes to %s frames per second",
+                      self._refresh_hz)
+            self._renderer = FrameRenderer(self._write_frame,
+                                           self._refresh_hz)
+            self._lock = threading.Lock()
+
     def __enter__(self):
         return self
 
@@ -205,9 +375,25 @@ class Writer(object):
                 self._abort(msg="\nKeyboard interrupt registered\n")
                 # Raise so that caller can decide how to handle.
                 raise
+        self._finish(failed)
 
+    def _finish(self, failed):
+        """Write the remaining output after the workers are done.
+
+        Parameters
+        ----------
+        failed : list or None
+            Failed workers, as returned by `wait`.
+        """
+        self._stop_renderer()
+        if self._mode == "update" and self._offscreen_stale \
+           and self._repaint == "visible_then_all":
+            self._write_full_table()
         if self._mode == "final":
-            self._stream.write(str(self._content))
+            for chunk in self._content.render_chunks():
+                self._stream.write(chunk)
+        elif self._mode == "log":
+            self._stream.write(self._content.finish())
         if self._mode != "update" and self._last_summary is not None:
             self._stream.write(str(self._last_summary))
 
@@ -233,25 +419,54 @@ class Writer(object):
         self._ids = columns
 
     def _process_futures(self):
-        """Process each future as it completes.
+        """Wait for the outstanding futures and their callbacks.
 
         If _continue_on_failure is false, raise the exception of the first
         failed future encountered.  Otherwise return a list of futures that had
         an exception.
         """
-        failed = []
         lgr.debug("Waiting for asynchronous calls")
-        continue_on_failure = self._continue_on_failure
-        for id_key, futures in self._futures.items():
-            for future in cfut.as_completed(futures):
-                lgr.debug("Processing future %s", future)
-                if not future.cancelled() and future.exception():
-                    if continue_on_failure:
-                        failed.append((id_key, future))
-                    else:
-                        future.result()  # Raise exception.
+        stop_on_failure = not self._continue_on_failure
+
+        # A future is dropped from _pending by the last of its done callbacks,
+        # so the results have been written by the time _pending is empty.
+        # (Waiting on the futures themselves isn't enough because their done
+        # callbacks run after waiters are woken.)
+        def finished():
+            return not self._pending or (stop_on_failure and self._failed)
+
+        with self._done_cond:
+            self._done_cond.wait_for(finished)
+
+        with self._futures_lock:
+            failed = [(id_key, future)
+                      for future, id_key in self._failed.items()]
+        if failed and stop_on_failure:
+            failed[0][1].result()  # Raise exception.
         return failed
 
+    def _register_future(self, id_key, future):
+        with self._futures_lock:
+            self._futures.setdefault(id_key, set()).add(future)
+            self._pending[future] = id_key
+
+    def _forget_future(self, id_key, future):
+        with self._futures_lock:
+            self._record_done(future, id_key)
+
+    def _record_done(self, future, id_key):
+        """Drop `future` from the outstanding futures.
+
+        This must be called with _futures_lock held.
+        """
+        if self._pending.pop(future, None) is not None:
+            futures = self._futures[id_key]
+            futures.discard(future)
+            if not futures:
+                del self._futures[id_key]
+        if not future.cancelled() and future.exception():
+            self._failed[future] = id_key
+
     def _print_async_exceptions(self, failed_futures):
         import traceback
 
@@ -273,18 +488,31 @@ class Writer(object):
                         "Producing value for row {} failed:\n{}\n"
                         .format(id_key, traceback.format_exc()))
 
+    def _stop_renderer(self):
+        if self._renderer is not None:
+            self._renderer.stop()
+
+    def _workers_started(self):
+        """Whether any asynchronous workers have been started.
+        """
+        return self._pool is not None
+
     @skip_if_aborted
     def _abort(self, cause=None, msg=None):
-        if self._pool is None:
+        if not self._workers_started():
             # No asynchronous calls; there's nothing to abort.
             return
 
+        # Get out any rows that were submitted before the abort.
+        self._stop_renderer()
+
         with self._write_lock():
             self._aborted = cause or True
             stream = self._stream
             if msg:
                 stream.write(msg)
-            futures = list(chain(*self._futures.values()))
+            with self._futures_lock:
+                futures = list(self._pending)
             for f in futures:
                 lgr.debug("Calling .cancel() with for %s", f)
                 f.cancel()
@@ -292,9 +520,11 @@ class Writer(object):
         stream.write("Canceled pending asynchronous workers. "
                      "{} worker{} already running\n"
                      .format(n_running, "" if n_running == 1 else "s"))
-        # Note: We can't call shutdown() with wait=True here.  That will
-        # trigger a RuntimeError in underlying <thread>.join() call.
-        self._pool.shutdown(wait=False)
+        if self._pool is not None and self._executor is None:
+            # Note: We can't call shutdown() with wait=True here.  That will
+            # trigger a RuntimeError in underlying <thread>.join() call.
+            self._pool.shutdown(wait=False)
+        self._shutdown_process_pool(wait=False)
 
     def wait(self):
         """Wait for asynchronous calls to return.
@@ -305,6 +535,7 @@ class Writer(object):
         """
         lgr.debug("Waiting for asynchronous calls")
         if self._pool is None:
+            self._stop_renderer()
             return
         aborted = self._aborted
         if aborted:
@@ -312,8 +543,11 @@ class Writer(object):
                 aborted.result()  # Raise exception.
         else:
             failed = self._process_futures()
-            self._pool.shutdown(wait=True)
-            lgr.debug("Pool shut down")
+            self._shutdown_process_pool(wait=True)
+            if self._executor is None:
+                self._pool.shutdown(wait=True)
+                lgr.debug("Pool shut down")
+            self._stop_renderer()
             return failed
 
     @contextmanager
@@ -335,13 +569,46 @@ class Writer(object):
                 self._lock.release()
 
     def _write(self, row, style=None):
+        if self._renderer is not None:
+            idkey = tuple(row[c] for c in self.ids)
+            self._renderer.submit(idkey, row, style)
+        else:
+            with self._write_lock():
+                self._write_fn(row, style)
+
+    def _write_many(self, rows):
+        if self._renderer is not None:
+            for row, style in rows:
+                idkey = tuple(row[c] for c in self.ids)
+                self._renderer.submit(idkey, row, style)
+        else:
+            with self._write_lock():
+                self._write_many_fn(rows)
+
+    def _write_frame(self, rows):
+        """Write a batch of (row, style) tuples under a single lock.
+        """
         with self._write_lock():
-            self._write_fn(row, style)
+            self._write_many_fn(rows)
 
     def _get_last_summary_length(self):
         last_summary = self._last_summary
         return len(last_summary.splitlines()) if last_summary else 0
 
+    def _write_full_table(self):
+        """Write the whole table below the current output.
+
+        This is used to bring lines that scrolled off screen up to date
+        after "visible" repaints.
+        """
+        last_summary_len = self._get_last_summary_length()
+        if last_summary_len > 0:
+            self._stream.clear_last_lines(last_summary_len)
+        lgr.debug("Writing whole table to replace stale off-screen lines")
+        self._stream.write(str(self._content))
+        if self._last_summary is not None:
+            self._stream.write(self._last_summary)
+
     def _write_update(self, row, style=None):
         last_summary_len = self._get_last_summary_length()
         if last_summary_len > 0:
@@ -353,20 +620,24 @@ class Writer(object):
 
         content, status, summary = self._content.update(row, style)
 
+        n_visible = min(
+            self._stream.height - last_summary_len - 1,  # -1 for current line.
+            self._last_content_len)
+        visible_only = self._repaint != "all"
+
         single_row_updated = False
         if isinstance(status, int):
-            height = self._stream.height
-            n_visible = min(
-                height - last_summary_len - 1,  # -1 for current line.
-                self._last_content_len)
-
             n_back = self._last_content_len - status
             if n_back > n_visible:
                 lgr.debug("Cannot move back %d rows for update; "
                           "only %d visible rows",
                           n_back, n_visible)
-                status = "repaint"
-                content = str(self._content)
+                if visible_only:
+                    # The visible lines are unaffected.
+                    self._offscreen_stale = True
+                    content = ""
+                else:
+                    status = "repaint"
             else:
                 lgr.debug("Moving up %d line(s) to overwrite line %d with %r",
                           n_back, status, row)
@@ -375,10 +646,17 @@ class Writer(object):
 
         if not single_row_updated:
             if status == "repaint":
-                lgr.debug("Moving up %d line(s) to repaint the whole thing. "
-                          "Blame row %r",
-                          self._last_content_len, row)
-                self._stream.move_to(self._last_content_len)
+                if visible_only:
+                    n_back = n_visible
+                    n_offscreen = self._last_content_len - n_visible
+                    if n_offscreen:
+                        self._offscreen_stale = True
+                else:
+                    n_back, n_offscreen = self._last_content_len, 0
+                lgr.debug("Moving up %d line(s) to repaint. Blame row %r",
+                          n_back, row)
+                self._stream.move_to(n_back)
+                content = self._content.render(start=n_offscreen)
             self._stream.write(content)
 
         if summary is not None:
@@ -387,19 +665,78 @@ class Writer(object):
         self._last_content_len = len(self._content)
         self._last_summary = summary
 
+    def _write_update_many(self, rows):
+        last_summary_len = self._get_last_summary_length()
+        if last_summary_len > 0:
+            lgr.debug("Clearing summary of %d line(s)", last_summary_len)
+            self._stream.clear_last_lines(last_summary_len)
+
+        adjusted, lines, summary = self._content.extend(rows)
+        if adjusted:
+            start = 0
+        elif lines:
+            start = lines[0]
+        else:
+            start = len(self._content)
+
+        last_content_len = self._last_content_len
+        n_visible = min(
+            self._stream.height - last_summary_len - 1,  # -1 for current line.
+            last_content_len)
+        n_back = last_content_len - start
+        if n_back > n_visible:
+            if self._repaint == "all":
+                n_back, start = last_content_len, 0
+            else:
+                n_back, start = n_visible, last_content_len - n_visible
+                self._offscreen_stale = True
+        if n_back:
+            lgr.debug("Moving up %d line(s) to write batch", n_back)
+            self._stream.move_to(n_back)
+        self._stream.write(self._content.render(start=start))
+
+        if summary is not None:
+            self._stream.write(summary)
+        self._last_content_len = len(self._content)
+        self._last_summary = summary
+
     def _write_incremental(self, row, style=None):
         content, status, summary = self._content.update(row, style)
         if isinstance(status, int):
             lgr.debug("Duplicating line %d with %r", status, row)
         elif status == "repaint":
             lgr.debug("Duplicating the whole thing.  Blame row %r", row)
+            content = str(self._content)
         self._stream.write(content)
         self._last_summary = summary
 
-    def _write_final(self, row, style=None):
-        _, _, summary = self._content.update(row, style)
+    def _write_incremental_many(self, rows):
+        adjusted, lines, summary = self._content.extend(rows)
+        if adjusted:
+            lgr.debug("Duplicating the whole thing for batch")
+            content = str(self._content)
+        else:
+            lgr.debug("Duplicating or adding %d line(s) for batch",
+                      len(lines))
+            content = self._content.render_lines(lines)
+        self._stream.write(content)
         self._last_summary = summary
 
+    def _write_final(self, row, style=None):
+        # Nothing is shown until exit, at which point everything is rendered
+        # in one pass.
+        self._content.store(row, style)
+
+    def _write_final_many(self, rows):
+        for row, style in rows:
+            self._content.store(row, style)
+
+    def _write_log(self, row, style=None):
+        self._stream.write(self._content.update(row, style))
+
+    def _write_log_many(self, rows):
+        self._stream.write(self._content.extend(rows))
+
     @skip_if_aborted
     def _write_async_result(self, id_vals, cols, result):
         lgr.debug("Received result for %s: %s",
@@ -428,16 +765,29 @@ class Writer(object):
         id_vals = {c: row[c] for c in self.ids}
 
         if self._pool is None:
-            lgr.debug("Initializing pool with max workers=%s",
-                      self._max_workers)
-            self._pool = Pool(max_workers=self._max_workers)
+            if self._executor is None:
+                lgr.debug("Initializing pool with max workers=%s",
+                          self._max_workers)
+                self._pool = Pool(max_workers=self._max_workers)
+            else:
+                lgr.debug("Using executor %s", self._executor)
+                self._pool = self._executor
         if self._lock is None:
             lgr.debug("Initializing lock")
             self._lock = threading.Lock()
 
         for cols, fn in callables:
+            pool = self._pool
+            in_process = self._runs_in_process(cols)
+            if in_process and inspect.isgenerator(fn):
+                lgr.debug("Generator object for cols %r can't be sent to "
+                          "another process; running it in a thread", cols)
+                in_process = False
+
             gen = None
-            if inspect.isgeneratorfunction(fn):
+            if in_process:
+                process_pool = self._get_process_pool()
+            elif inspect.isgeneratorfunction(fn):
                 gen = fn()
             elif inspect.isgenerator(fn):
                 gen = fn
@@ -453,25 +803,39 @@ class Writer(object):
                     ok = True
                 return ok
 
-            if gen:
+            if in_process and inspect.isgeneratorfunction(fn):
+                lgr.debug("Streaming generator for cols %r of row %r "
+                          "from another process", cols, id_vals)
+                # The generator runs in a worker process, and a thread
+                # writes the items as they come back.
+                async_fn = partial(self._write_from_process, process_pool,
+                                   self._get_manager().Queue(), fn,
+                                   id_vals, cols)
+                callback = check_result
+            elif gen:
                 lgr.debug("Wrapping generator for cols %r of row %r",
                           cols, id_vals)
 
-                def async_fn():
+                # Bind the loop variables now.  The call (and callback) may
+                # happen after later iterations have rebound them.
+                def async_fn(gen=gen, cols=cols):
                     for i in gen:
                         self._write_async_result(id_vals, cols, i)
 
                 callback = check_result
             else:
+                if in_process:
+                    pool = process_pool
                 async_fn = fn
 
-                def callback(future):
+                def callback(future, cols=cols):
                     if check_result(future):
                         self._write_async_result(
                             id_vals, cols, future.result())
 
+            self._wait_for_room()
             try:
-                future = self._pool.submit(async_fn)
+                future = pool.submit(async_fn)
             except RuntimeError as exc:
                 # We can get here if, between entering this method call and
                 # calling .submit(), _aborted was set by a callback.
@@ -483,9 +847,89 @@ class Writer(object):
                 else:
                     raise
             else:
-                future.add_done_callback(callback)
                 lgr.debug("Registering future %s for %s", future, id_key)
-                self._futures[id_key].append(future)
+                self._register_future(id_key, future)
+                future.add_done_callback(callback)
+                # Added after `callback` so that waiters see the result.
+                future.add_done_callback(
+                    partial(self._forget_future, id_key))
+                future.add_done_callback(self._notify_done)
+
+    def _runs_in_process(self, cols):
+        style = self._content.fields.style
+        return any(style[c].get("executor") == "process" for c in cols)
+
+    def _get_process_pool(self):
+        if self._process_pool is None:
+            lgr.debug("Initializing process pool with max workers=%s",
+                      self._max_workers)
+            self._process_pool = cfut.ProcessPoolExecutor(
+                max_workers=self._max_workers)
+        return self._process_pool
+
+    def _get_manager(self):
+        if self._manager is None:
+            lgr.debug("Starting manager for queues to worker processes")
+            self._manager = multiprocessing.Manager()
+        return self._manager
+
+    def _shutdown_process_pool(self, wait):
+        # Stop reading from the queues before their manager goes away.
+        self._stop_reading.set()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
+        if self._manager is not None:
+            lgr.debug("Shutting down manager")
+            self._manager.shutdown()
+            self._manager = None
+
+    def _write_from_process(self, process_pool, items, genfn, id_vals, cols):
+        """Run generator function `genfn` in `process_pool`.
+
+        Each item that it yields is passed back over the `items` queue and
+        written.  Reading stops early if the process pool is shut down.
+        """
+        stop = self._stop_reading
+        future = process_pool.submit(_put_generated, genfn, items)
+        while True:
+            if stop.is_set():
+                lgr.debug("Stopped reading items for cols %r of row %r",
+                          cols, id_vals)
+                return
+            try:
+                done, item = items.get(timeout=0.1)
+            except queue.Empty:
+                if future.done():
+                    # The worker is gone without signaling that it's done
+                    # (e.g., because it couldn't be started).
+                    break
+                continue
+            except (EOFError, OSError):
+                if stop.is_set():
+                    # The manager was shut down while we were waiting.
+                    return
+                raise
+            if done:
+                break
+            self._write_async_result(id_vals, cols, item)
+        future.result()  # Raise any exception from the worker.
+
+    def _wait_for_room(self):
+        """Block until another producer can be submitted.
+        """
+        max_pending = self._max_pending
+        if max_pending is None:
+            return
+        with self._done_cond:
+            if len(self._pending) >= max_pending:
+                lgr.debug("Waiting for room among %d pending producers",
+                          max_pending)
+                self._done_cond.wait_for(
+                    lambda: len(self._pending) < max_pending or self._aborted)
+
+    def _notify_done(self, _future):
+        with self._done_cond:
+            self._done_cond.notify_all()
 
     def top_nrows_done(self, n):
         """Check if the top N rows' asynchronous workers are done.
@@ -531,27 +975,26 @@ class Writer(object):
         id_keys = (self._content.get_idkey(i) for i in idxs
                    if i is not None)
 
+        # Rows are only registered while they have outstanding futures.
         futures = self._futures
-        top_futures = list(chain(*(futures[k] for k in id_keys)))
-        if not top_futures:
-            # These rows have no registered producers.
-            return True
-        return all(f.done() for f in top_futures)
+        return not any(k in futures for k in id_keys)
 
     def _maybe_wait_on_top_rows(self):
         n = self._wait_for_top
-        if n:
-            waited = 0
-            secs = 0.5
-            while self.top_nrows_done(n) is False:
-                time.sleep(secs)
-                waited += 1
-            if waited:
-                lgr.debug("Waited for %s cycles of sleeping %s seconds",
-                          waited, secs)
-                # Wait a bit longer so that the caller has a chance to see the
-                # last updated row if it about to go off screen.
-                time.sleep(secs)
+        if not n:
+            return
+        cond = self._done_cond
+        with cond:
+            if self.top_nrows_done(n) is not False:
+                return
+            lgr.debug("Waiting for workers of top %d rows", n)
+            start = time.time()
+            cond.wait_for(lambda: self.top_nrows_done(n) is not False)
+        lgr.debug("Waited %.2f seconds for top rows", time.time() - start)
+        if self._wait_for_top_delay:
+            # Wait a bit longer so that the caller has a chance to see the
+            # last updated row if it about to go off screen.
+            time.sleep(self._wait_for_top_delay)
 
     @skip_if_aborted
     def __call__(self, row, style=None):
@@ -605,6 +1048,65 @@ class Writer(object):
             lgr.debug("Starting callables for row %r", row)
             self._start_callables(row, callables)
 
+    @skip_if_aborted
+    def extend(self, rows, style=None):
+        """Write several styled rows at once.
+
+        This is equivalent to calling the instance with each row in `rows`,
+        except that the output is updated once for the whole batch rather than
+        once per row.
+
+        Parameters
+        ----------
+        rows : iterable, mapping, or structured array
+            Each item is a row as described in `__call__`.  Alternatively, the
+            rows can be given as columns, either with a mapping from column
+            names to sequences of values or with a NumPy structured array.
+            The values of a columnar batch are written as is (i.e., they
+            can't be producers), and each row is created from the columns
+            only as it's written.
+        style : dict, optional
+            A style to apply to all of the rows.  See `__call__`.
+        """
+        self._maybe_wait_on_top_rows()
+        names = RowNormalizer.columnar_names(rows)
+        if names is not None:
+            if self._columns is None:
+                self._columns = names
+                lgr.debug("Inferred columns: %r", self._columns)
+            if self._normalizer is None:
+                self._init_prewrite()
+            nrows, rows = self._normalizer.columnar(rows)
+            lgr.debug("Writing columnar batch of %d row(s)", nrows)
+            if nrows:
+                self._write_many((row, style) for row in rows)
+            return
+
+        rows = iter(rows)
+        try:
+            first = next(rows)
+        except StopIteration:
+            return
+        if self._columns is None:
+            self._columns = self._infer_columns(first)
+            lgr.debug("Inferred columns: %r", self._columns)
+        if self._normalizer is None:
+            self._init_prewrite()
+
+        normalizer = self._normalizer
+        batch = []
+        pending = []
+        for row in chain([first], rows):
+            callables, row = normalizer(row)
+            batch.append((row, style))
+            if callables:
+                pending.append((row, callables))
+        lgr.debug("Writing batch of %d row(s)", len(batch))
+        self._write_many(batch)
+        for row, callables in pending:
+            lgr.debug("Starting callables for row %r", row)
+            self._start_callables(row, callables)
+
     @staticmethod
     def _infer_columns(row):
         try:
@@ -641,3 +1143,208 @@ class Writer(object):
         except KeyError as exc:
             # Suppress context.
             raise KeyError(exc) from None
+
+
+class AsyncWriter(Writer):
+    """Writer that runs coroutine-based producers on an asyncio event loop.
+
+    In addition to the producers that Writer supports, a producer can be a
+    coroutine function, an awaitable, an async generator function, or an async
+    generator.  These are scheduled as tasks on the running event loop, so
+    rows with such producers must be written from within a coroutine.  At
+    most `max_workers` (100 by default) of the tasks are run at once.  Other
+    producers are still run in a thread (or process) pool.
+
+    Writing a row can't wait without blocking the event loop, so
+    `wait_for_top` and `max_pending` have no effect for rows written from
+    within a coroutine, whatever their producers.
+
+    The instance should be used as an asynchronous context manager or be
+    followed by a call to the `wait` coroutine.
+    """
+
+    _default_max_tasks = 100
+
+    def __init__(self, columns=None, style=None, stream=None,
+                 interactive=None, mode=None, continue_on_failure=True,
+                 wait_for_top=3, max_workers=None, *, wait_for_top_delay=0.5,
+                 max_pending=None, executor=None, refresh_hz=None,
+                 repaint="all", log_sample=100):
+        super(AsyncWriter, self).__init__(
+            columns, style, stream=stream,
+            interactive=interactive, mode=mode,
+            continue_on_failure=continue_on_failure,
+            wait_for_top=wait_for_top,
+            wait_for_top_delay=wait_for_top_delay, max_workers=max_workers,
+            max_pending=max_pending, executor=executor,
+            refresh_hz=refresh_hz, repaint=repaint,
+            log_sample=log_sample)
+        # These are set when the first task is created.
+        self._loop = None
+        self._semaphore = None
+        # Unlike futures, tasks aren't registered with the rows they update.
+        # The rows are written synchronously, so waiting for the top rows'
+        # tasks to finish would block the loop that runs them.
+        self._tasks = {}  # outstanding task => id key
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with {}"
+                        .format(self.__class__.__name__))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, _exc_type, exc_value, _tb):
+        failed = None
+        if exc_value is not None:
+            self._abort(msg="\n{!r} raised\n".format(exc_value))
+        else:
+            try:
+                failed = await self.wait()
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                lgr.debug("Interrupted while waiting for asynchronous workers")
+                self._abort(msg="\nWaiting for asynchronous workers "
+                                "was interrupted\n")
+                raise
+        self._finish(failed)
+
+    @staticmethod
+    def _in_event_loop():
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def _maybe_wait_on_top_rows(self):
+        if self._in_event_loop():
+            # Blocking would stall the loop, including the tasks of the rows
+            # that we'd be waiting on.
+            lgr.debug("Not waiting for top rows within event loop")
+            return
+        super(AsyncWriter, self)._maybe_wait_on_top_rows()
+
+    def _wait_for_room(self):
+        if self._in_event_loop():
+            lgr.debug("Not waiting for pending producers within event loop")
+            return
+        super(AsyncWriter, self)._wait_for_room()
+
+    @staticmethod
+    def _is_async(producer):
+        return (inspect.iscoroutinefunction(producer)
+                or inspect.isasyncgenfunction(producer)
+                or inspect.isawaitable(producer)
+                or inspect.isasyncgen(producer))
+
+    def _workers_started(self):
+        return (self._loop is not None
+                or super(AsyncWriter, self)._workers_started())
+
+    @skip_if_aborted
+    def _abort(self, cause=None, msg=None):
+        if self._tasks:
+            try:
+                in_loop = asyncio.get_running_loop() is self._loop
+            except RuntimeError:
+                in_loop = False
+            for task in list(self._tasks):
+                lgr.debug("Canceling task %s", task)
+                if in_loop:
+                    task.cancel()
+                else:
+                    self._loop.call_soon_threadsafe(task.cancel)
+        super(AsyncWriter, self)._abort(cause=cause, msg=msg)
+
+    async def wait(self):
+        """Wait for asynchronous calls to return.
+
+        This is a coroutine.
+
+        Returns
+        -------
+        A list of (id key, future) tuples for asynchronous calls that had an
+        exception.  For producers run on the event loop, the future is a
+        task.
+        """
+        lgr.debug("Waiting for tasks")
+        if self._continue_on_failure:
+            return_when = asyncio.ALL_COMPLETED
+        else:
+            return_when = asyncio.FIRST_EXCEPTION
+        while self._tasks and not self._aborted:
+            lgr.debug("Waiting for %d outstanding task(s)", len(self._tasks))
+            await asyncio.wait(list(self._tasks), return_when=return_when)
+        aborted = self._aborted
+        if isinstance(aborted, asyncio.Future):
+            aborted.result()  # Raise exception.
+
+        if self._pool is None:
+            if aborted:
+                return
+            self._stop_renderer()
+            return [(id_key, task) for task, id_key in self._failed.items()]
+        # Waiting for the pool blocks, so do it outside of the loop.
+        return await asyncio.get_running_loop().run_in_executor(
+            None, super(AsyncWriter, self).wait)
+
+    @skip_if_aborted
+    def _start_callables(self, row, callables):
+        """Start running `callables` asynchronously.
+
+        Coroutine-based producers are scheduled on the running event loop, and
+        the rest are passed on to Writer._start_callables.
+        """
+        producers = []
+        others = []
+        for cols, fn in callables:
+            if self._is_async(fn):
+                producers.append((cols, fn))
+            else:
+                others.append((cols, fn))
+        if others:
+            super(AsyncWriter, self)._start_callables(row, others)
+        if not producers:
+            return
+
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            limit = self._max_workers or self._default_max_tasks
+            lgr.debug("Initializing semaphore for %d task(s)", limit)
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(limit)
+        elif loop is not self._loop:
+            raise RuntimeError("Producers must be run on the same event loop")
+        if self._lock is None:
+            lgr.debug("Initializing lock")
+            self._lock = threading.Lock()
+
+        id_key = tuple(row[c] for c in self.ids)
+        id_vals = {c: row[c] for c in self.ids}
+        for cols, producer in producers:
+            task = loop.create_task(
+                self._run_producer(producer, id_vals, cols))
+            lgr.debug("Registering task %s for %s", task, id_key)
+            self._tasks[task] = id_key
+            task.add_done_callback(self._task_done)
+
+    async def _run_producer(self, producer, id_vals, cols):
+        async with self._semaphore:
+            if inspect.iscoroutinefunction(producer) \
+               or inspect.isasyncgenfunction(producer):
+                producer = producer()
+            if inspect.isasyncgen(producer):
+                async for item in producer:
+                    self._write_async_result(id_vals, cols, item)
+            else:
+                self._write_async_result(id_vals, cols, await producer)
+
+    def _task_done(self, task):
+        id_key = self._tasks.pop(task)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            with self._futures_lock:
+                self._failed[task] = id_key
+            if not self._continue_on_failure:
+                self._abort(cause=task)
@@ -1,14 +1,177 @@
 """Summarize output.
 """
 
+from bisect import bisect_left
+from bisect import insort
+from collections import Counter
 from collections.abc import Mapping
 from logging import getLogger
 
+from pyout import elements
 from pyout.field import Nothing
 
 lgr = getLogger(__name__)
 
 
+class Aggregate(object):
+    """Base class for summary functions that are updated incrementally.
+
+    A plain callable given as a column's "aggregate" value is called with all
+    of the column's values each time the summary is regenerated.  A subclass
+    of this class instead describes how to fold values into a running state,
+    so each row update costs a constant amount of work.
+
+    Instances do not hold any state themselves; the state is created by `init`
+    and threaded through the other methods by Summary.  Therefore a single
+    instance can be shared between columns.
+    """
+
+    def init(self):
+        """Return the initial state.
+        """
+        raise NotImplementedError
+
+    def add(self, state, value):
+        """Return `state` updated to include `value`.
+        """
+        raise NotImplementedError
+
+    def remove(self, state, value):
+        """Return `state` updated to exclude a previously added `value`.
+        """
+        raise NotImplementedError
+
+    def result(self, state):
+        """Return the summary value(s) for `state`.
+
+        As with a plain callable, this can be either a single value or a list
+        of values.
+        """
+        raise NotImplementedError
+
+
+class Sum(Aggregate):
+    """Sum of the column values.
+    """
+
+    def init(self):
+        return 0
+
+    def add(self, state, value):
+        return state + value
+
+    def remove(self, state, value):
+        return state - value
+
+    def result(self, state):
+        return state
+
+
+class Count(Aggregate):
+    """Number of non-missing values in the column.
+    """
+
+    def init(self):
+        return 0
+
+    def add(self, state, _):
+        return state + 1
+
+    def remove(self, state, _):
+        return state - 1
+
+    def result(self, state):
+        return state
+
+
+class Min(Aggregate):
+    """Smallest column value.
+
+    An empty string is displayed if the column doesn't have any values.  NaN
+    values are ignored.
+    """
+
+    def init(self):
+        return []
+
+    def add(self, state, value):
+        if value != value:
+            # NaN can't be placed in the sorted values.
+            return state
+        insort(state, value)
+        return state
+
+    def remove(self, state, value):
+        if value != value:
+            return state
+        idx = bisect_left(state, value)
+        if idx < len(state) and state[idx] == value:
+            del state[idx]
+        else:
+            state.remove(value)
+        return state
+
+    def result(self, state):
+        return state[0] if state else ""
+
+
+class Max(Min):
+    """Largest column value.
+
+    An empty string is displayed if the column doesn't have any values.
+    """
+
+    def result(self, state):
+        return state[-1] if state else ""
+
+
+class Mean(Aggregate):
+    """Arithmetic mean of the column values.
+
+    An empty string is displayed if the column doesn't have any values.
+    """
+
+    def init(self):
+        return 0, 0
+
+    def add(self, state, value):
+        total, n = state
+        return total + value, n + 1
+
+    def remove(self, state, value):
+        total, n = state
+        return total - value, n - 1
+
+    def result(self, state):
+        total, n = state
+        return total / n if n else ""
+
+
+class ValueCounts(Aggregate):
+    """Count occurrences of each distinct value.
+
+    The result is a list with a "value: count" item for each value, sorted by
+    the value's string representation.
+    """
+
+    def init(self):
+        return Counter()
+
+    def add(self, state, value):
+        state[value] += 1
+        return state
+
+    def remove(self, state, value):
+        state[value] -= 1
+        if not state[value]:
+            del state[value]
+        return state
+
+    def result(self, state):
+        return ["{}: {:d}".format(k, state[k])
+                for k in sorted(state, key=str)]
+
+
 class Summary(object):
     """Produce summary rows for a list of normalized rows.
 
@@ -23,9 +186,48 @@ class Summary(object):
         self._enabled = any("aggregate" in v for v in self.style.values()
                             if isinstance(v, Mapping))
 
+        # column => Aggregate instance, for columns summarized incrementally.
+        self._aggregates = {
+            c: v["aggregate"] for c, v in self.style.items()
+            if c not in elements.schema["properties"]
+            and isinstance(v, Mapping)
+            and isinstance(v.get("aggregate"), Aggregate)}
+        self._states = {c: agg.init() for c, agg in self._aggregates.items()}
+
     def __bool__(self):
         return self._enabled
 
+    def _fold(self, method, row):
+        states = self._states
+        for col, agg in self._aggregates.items():
+            if col not in row or isinstance(row[col], Nothing):
+                continue
+            value = row[col]
+            states[col] = getattr(agg, method)(states[col], value)
+
+    def add(self, row):
+        """Include the values of `row` in the incremental summaries.
+
+        Parameters
+        ----------
+        row : dict
+            A normalized row.
+        """
+        self._fold("add", row)
+
+    def remove(self, row):
+        """Exclude the values of `row` from the incremental summaries.
+
+        This should be called with the previous values of a row before it is
+        updated and then followed by an `add` call with the new values.
+
+        Parameters
+        ----------
+        row : dict
+            A normalized row.
+        """
+        self._fold("remove", row)
+
     def summarize(self, columns, rows):
         """Return summary rows.
 
@@ -33,8 +235,11 @@ class Summary(object):
         ----------
         columns : list of str
             Summarize values within these columns.
-        rows : list of dicts
-            Normalized rows that contain keys for `columns`.
+        rows : iterable of dicts
+            Normalized rows that contain keys for `columns`.  These are only
+            consumed if a column's aggregate is a plain callable.  Columns with
+            an Aggregate instance are instead summarized using the state built
+            up by `add` and `remove`.
 
         Returns
         -------
@@ -48,6 +253,11 @@ class Summary(object):
         summaries = {}
         for col, agg_fn in agg_styles.items():
             lgr.debug("Summarizing column %r with %r", col, agg_fn)
+            if col in self._aggregates:
+                summaries[col] = agg_fn.result(self._states[col])
+                continue
+            if not isinstance(rows, list):
+                rows = list(rows)
             colvals = filter(lambda x: not isinstance(x, Nothing),
                              (row[col] for row in rows))
             summaries[col] = agg_fn(list(colvals))
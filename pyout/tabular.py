@@ -99,12 +99,16 @@ class Tabular(interface.Writer):
         determined by calling `stream.isatty()`.  If non-interactive, the bold,
         color, and underline keys will be ignored, and the mode will default to
         "final".
-    mode : {update, incremental, final}, optional
+    mode : {update, incremental, final, log}, optional
         Mode of display.
         * update (default): Go back and update the fields.  This includes
           resizing the automated widths.
         * incremental: Don't go back to update anything.
         * final: finalized representation appropriate for redirecting to file
+        * log: Write each row as a new line and then forget it.  Automatic
+          widths are inferred from the first rows (see `log_sample`).  Memory
+          use doesn't grow with the number of rows, which makes this suitable
+          for piping a large number of rows.  Summaries are not shown.
 
         Defaults to "update" if the stream supports updates and "incremental"
         otherwise.  If the stream is non-interactive, defaults to "final".
@@ -121,6 +125,39 @@ class Tabular(interface.Writer):
         asynchronously (i.e., when producers are specified as row values).  The
         default matches the default of `concurrent.futures.ThreadPoolExecutor`
         as of Python 3.8: `min(32, os.cpu_count() + 4)`.
+    wait_for_top_delay : int or float, optional
+        After having waited for the top-most rows, wait this many more seconds
+        before adding the row so that the last update to the top row can be
+        seen before it goes off screen.
+    max_pending : int, optional
+        If specified, don't let more than this many producers be running or
+        queued at once.  Writing a row with a producer blocks until there is
+        room, which keeps memory bounded when many rows with producers are
+        written faster than the workers can process them.
+    executor : concurrent.futures.Executor, optional
+        Run producers with this executor instead of a thread pool that is
+        created (and shut down) by the instance.  The executor is not shut
+        down, so it can be shared between instances.  `max_workers` has no
+        effect on this executor.  Producers of columns with an "executor"
+        style of "process" are instead run in a process pool that is created
+        by the instance.
+    refresh_hz : int or float, optional
+        If specified, don't write rows as they come in.  Instead collect them,
+        merging repeated updates to the same row, and write them from a
+        background thread at most this many times per second.  Pending rows
+        are written when `wait` is called or the context manager exits.  This
+        has no effect in "final" mode.
+    repaint : {all, visible, visible_then_all}, optional
+        How to redraw the table in "update" mode when column widths change.
+        * all (default): Rewrite every line.
+        * visible: Rewrite only the lines that are still on screen, leaving
+          lines that have scrolled off screen with their old rendering.
+          Updates to off-screen rows are not displayed.
+        * visible_then_all: Like "visible", but if any off-screen lines went
+          out of date, write the whole table once more at exit.
+    log_sample : int, optional
+        In "log" mode, hold back this many rows to infer the automatic column
+        widths from.  Later values that don't fit are truncated.
 
     Examples
     --------
@@ -146,15 +183,49 @@ class Tabular(interface.Writer):
 
     def __init__(self, columns=None, style=None, stream=None,
                  interactive=None, mode=None, continue_on_failure=True,
-                 wait_for_top=3, max_workers=None):
+                 wait_for_top=3, max_workers=None, *, wait_for_top_delay=0.5,
+                 max_pending=None, executor=None, refresh_hz=None,
+                 repaint="all", log_sample=100):
         super(Tabular, self).__init__(
             columns, style, stream=stream,
             interactive=interactive, mode=mode,
             continue_on_failure=continue_on_failure,
-            wait_for_top=wait_for_top, max_workers=max_workers)
+            wait_for_top=wait_for_top,
+            wait_for_top_delay=wait_for_top_delay, max_workers=max_workers,
+            max_pending=max_pending, executor=executor,
+            refresh_hz=refresh_hz, repaint=repaint,
+            log_sample=log_sample)
         streamer = TerminalStream(stream=stream, interactive=interactive)
         if streamer.interactive:
             processors = TermProcessors(streamer.term)
         else:
             processors = None
         super(Tabular, self)._init(style, streamer, processors)
+
+
+class AsyncTabular(interface.AsyncWriter, Tabular):
+    """Like `Tabular`, but run coroutine-based producers on an event loop.
+
+    Producers can also be coroutine functions, awaitables, async generator
+    functions, or async generators.  They are run as tasks on the running
+    event loop rather than in threads, with at most `max_workers` (100 by
+    default) running at once.  Other producers are handled as with `Tabular`.
+    Use the instance as an asynchronous context manager, or await its `wait`
+    method.
+
+    The parameters are the same as for `Tabular`.  However, rows written from
+    within a coroutine don't wait, so `wait_for_top`, `wait_for_top_delay`,
+    and `max_pending` don't apply to them, whether their producers run on the
+    event loop or in a pool.  Bound the number of running tasks with
+    `max_workers` instead.
+
+    Examples
+    --------
+
+    >>> async def get_status(name):
+    ...     ...
+    >>> async def main(names):
+    ...     async with AsyncTabular(["name", "status"]) as out:
+    ...         for name in names:
+    ...             out({"name": name, "status": get_status(name)})
+    """
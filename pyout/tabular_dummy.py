@@ -46,12 +46,25 @@ class Tabular(interface.Writer):
 
     def __init__(self, columns=None, style=None, stream=None,
                  interactive=None, mode=None, continue_on_failure=True,
-                 wait_for_top=3, max_workers=None):
+                 wait_for_top=3, max_workers=None, *, wait_for_top_delay=0.5,
+                 max_pending=None, executor=None, refresh_hz=None,
+                 repaint="all", log_sample=100):
         super(Tabular, self).__init__(
             columns, style, stream=stream,
             interactive=interactive, mode=mode,
             continue_on_failure=continue_on_failure,
-            wait_for_top=wait_for_top, max_workers=max_workers)
+            wait_for_top=wait_for_top,
+            wait_for_top_delay=wait_for_top_delay, max_workers=max_workers,
+            max_pending=max_pending, executor=executor,
+            refresh_hz=refresh_hz, repaint=repaint,
+            log_sample=log_sample)
         streamer = NoUpdateTerminalStream(
             stream=stream, interactive=interactive)
         super(Tabular, self)._init(style, streamer)
+
+
+class AsyncTabular(interface.AsyncWriter, Tabular):
+    """Like `pyout.tabular.AsyncTabular`, but broken.
+
+    See `Tabular` for the limitations.
+    """
@@ -4,6 +4,7 @@
 from io import StringIO
 from unittest.mock import patch
 
+from pyout import AsyncTabular as TheRealAsyncTabular
 from pyout import Tabular as TheRealTabular
 from pyout.tests.terminal import Terminal
 
@@ -27,3 +28,23 @@ class Tabular(TheRealTabular):
     @property
     def stdout(self):
         return self._stream.stream.getvalue()
+
+
+class AsyncTabular(TheRealAsyncTabular):
+    """Test-specific subclass of pyout.AsyncTabular.
+
+    See `Tabular`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        stream = kwargs.pop("stream", None)
+        if not stream:
+            stream = StringIO()
+            stream.isatty = lambda: True
+        with patch("pyout.tabular.Terminal", Terminal):
+            super(AsyncTabular, self).__init__(
+                *args, stream=stream, **kwargs)
+
+    @property
+    def stdout(self):
+        return self._stream.stream.getvalue()
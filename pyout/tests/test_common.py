@@ -0,0 +1,267 @@
+import random
+
+import pytest
+
+from pyout.common import RowNormalizer
+from pyout.common import StyleFields
+from pyout.field import Nothing
+from pyout.field import PlainProcessors
+
+
+def assign_widths_iteratively(columns, available):
+    """The original implementation of StyleFields._assign_widths.
+
+    This hands out width one claim at a time and serves as the reference for
+    the closed-form implementation.
+    """
+    assigned = {}
+
+    for column in columns:
+        col_wants = columns[column]["wants"]
+        if col_wants > 0:
+            available -= 1
+            assigned[column] = 1
+    assert available >= 0
+
+    weights = {c: columns[c].get("weight", 1) for c in columns}
+    colnames = sorted(assigned.keys(), reverse=True,
+                      key=lambda c: (columns[c]["min"], weights[c], c))
+    columns_in_need = set(assigned.keys())
+    while available > 0 and columns_in_need:
+        for column in colnames:
+            if column not in columns_in_need:
+                continue
+
+            col_wants = columns[column]["wants"] - assigned[column]
+            if col_wants < 1:
+                columns_in_need.remove(column)
+                continue
+
+            wmin = columns[column]["min"]
+            has = assigned[column]
+            claim = min(weights[column] if has >= wmin else wmin - has,
+                        col_wants,
+                        available)
+            available -= claim
+            assigned[column] += claim
+            if available == 0:
+                break
+    return assigned
+
+
+def test_assign_widths_examples():
+    columns = {"a": {"wants": 10, "min": 0, "weight": 1},
+               "b": {"wants": 10, "min": 0, "weight": 3},
+               "c": {"wants": 2, "min": 0}}
+    assert StyleFields._assign_widths(columns, 8) == {"a": 2, "b": 4, "c": 2}
+    assert StyleFields._assign_widths(columns, float("inf")) == \
+        {"a": 10, "b": 10, "c": 2}
+
+    columns = {"a": {"wants": 10, "min": 6, "weight": 1},
+               "b": {"wants": 0, "min": 0, "weight": 1}}
+    assert StyleFields._assign_widths(columns, 7) == {"a": 7}
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_assign_widths_matches_iterative(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        ncols = rng.randint(1, 8)
+        columns = {}
+        for idx in range(ncols):
+            value = {"wants": rng.choice([0, 1, rng.randint(1, 80)]),
+                     "min": rng.choice([0, rng.randint(1, 30)])}
+            if rng.random() < 0.7:
+                value["weight"] = rng.randint(1, 6)
+            # Vary the names so that their order in ties varies too.
+            columns["c{}".format(rng.randint(0, 2 * idx))] = value
+        nwanting = sum(v["wants"] > 0 for v in columns.values())
+        if rng.random() < 0.1:
+            available = float("inf")
+        else:
+            available = nwanting + rng.randint(0, 200)
+
+        expected = assign_widths_iteratively(columns, available)
+        assert StyleFields._assign_widths(columns, available) == expected, \
+            (columns, available)
+
+
+class Point(object):
+
+    def __init__(self, **kwds):
+        self.__dict__.update(kwds)
+
+
+@pytest.mark.parametrize("kind", ["mapping", "sequence", "attrs"])
+def test_row_normalizer(kind):
+    columns = ["a", "b", "c"]
+    style = {"a": {}, "b": {"missing": "-"}, "c": {}}
+    normalizer = RowNormalizer(columns, style)
+
+    def fn():
+        return "done"
+
+    values = [(1, 2, fn), (4, 5, 6)]
+    if kind == "mapping":
+        rows = [dict(zip(columns, v)) for v in values]
+        # Missing values are filled in.
+        rows.append({"a": 7})
+    elif kind == "sequence":
+        rows = values
+    else:
+        rows = [Point(**dict(zip(columns, v))) for v in values]
+        rows.append(Point(a=7))
+
+    callables, row = normalizer(rows[0])
+    assert callables == [(("c",), fn)]
+    assert row["a"] == 1 and row["b"] == 2
+    assert isinstance(row["c"], Nothing)
+
+    assert normalizer(rows[1]) == ([], {"a": 4, "b": 5, "c": 6})
+
+    if kind != "sequence":
+        callables, row = normalizer(rows[2])
+        assert not callables
+        assert row["a"] == 7
+        assert str(row["b"]) == "-"
+        assert isinstance(row["c"], Nothing)
+
+
+@pytest.mark.parametrize("kind", ["mapping", "sequence"])
+def test_row_normalizer_delayed(kind):
+    columns = ["a", "b", "c"]
+    style = {"a": {}, "b": {"delayed": "g"}, "c": {"delayed": "g"}}
+    normalizer = RowNormalizer(columns, style)
+    if kind == "mapping":
+        row = {"a": 1, "b": 2, "c": 3}
+    else:
+        row = [1, 2, 3]
+    callables, norm_row = normalizer(row)
+    assert norm_row["a"] == 1
+    assert len(callables) == 1
+    cols, fn = callables[0]
+    assert cols == ("b", "c")
+    assert fn() == {"b": 2, "c": 3}
+
+
+def test_row_normalizer_single_column_sequence():
+    normalizer = RowNormalizer(["a"], {"a": {}})
+    assert normalizer(["x"]) == ([], {"a": "x"})
+
+
+def test_row_normalizer_columnar():
+    normalizer = RowNormalizer(["a", "b", "c"],
+                               {"a": {}, "b": {"missing": "-"}, "c": {}})
+    nrows, rows = normalizer.columnar({"a": [1, 2], "c": (3, 4)})
+    assert nrows == 2
+    rows = list(rows)
+    assert [r["a"] for r in rows] == [1, 2]
+    assert [str(r["b"]) for r in rows] == ["-", "-"]
+    assert [r["c"] for r in rows] == [3, 4]
+
+    nrows, rows = normalizer.columnar({})
+    assert nrows == 0
+    assert list(rows) == []
+    with pytest.raises(ValueError):
+        normalizer.columnar({"a": [1, 2], "c": [3]})
+    with pytest.raises(ValueError):
+        normalizer.columnar([{"a": 1}])
+
+
+def test_row_normalizer_columnar_lazy():
+    normalizer = RowNormalizer(["a", "b"], {"a": {}, "b": {}})
+    nrows, rows = normalizer.columnar({"a": [1, 2], "b": [3, 4]})
+    assert nrows == 2
+    assert next(rows) == {"a": 1, "b": 3}
+    assert next(rows) == {"a": 2, "b": 4}
+    with pytest.raises(StopIteration):
+        next(rows)
+
+
+@pytest.mark.parametrize("batch",
+                         [{"a": "xy", "b": [1, 2]},
+                          {"a": [1, 2], "b": b"xy"},
+                          {"a": [1, 2], "b": (x for x in [3, 4])},
+                          {"a": [1, 2], "b": 3},
+                          {"a": [1, 2], "b": [3]},
+                          # A column that isn't displayed is checked too.
+                          {"a": [1, 2], "b": [3, 4], "c": [5]}],
+                         ids=["str", "bytes", "generator", "scalar",
+                              "length", "length-extra"])
+def test_row_normalizer_columnar_invalid(batch):
+    normalizer = RowNormalizer(["a", "b"], {"a": {}, "b": {}})
+    with pytest.raises(ValueError):
+        normalizer.columnar(batch)
+
+
+class FakeStructured(object):
+    """Mimic the parts of a NumPy structured array that are used.
+    """
+
+    class dtype(object):
+        names = ("a", "b")
+
+    def __getitem__(self, name):
+        return {"a": [1, 2], "b": ["x", "y"]}[name]
+
+
+def test_row_normalizer_columnar_structured():
+    normalizer = RowNormalizer(["a", "b"], {"a": {}, "b": {}})
+    data = FakeStructured()
+    assert RowNormalizer.columnar_names(data) == ["a", "b"]
+    nrows, rows = normalizer.columnar(data)
+    assert nrows == 2
+    assert list(rows) == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+
+
+def test_row_normalizer_columnar_numpy():
+    np = pytest.importorskip("numpy")
+    data = np.array([(1, b"x"), (2, b"y")],
+                    dtype=[("a", "i4"), ("b", "S1")])
+    normalizer = RowNormalizer(["a", "b"], {"a": {}, "b": {}})
+    assert RowNormalizer.columnar_names(data) == ["a", "b"]
+    _, rows = normalizer.columnar(data)
+    rows = list(rows)
+    assert rows == [{"a": 1, "b": b"x"}, {"a": 2, "b": b"y"}]
+    assert type(rows[0]["a"]) is int
+
+
+def test_style_fields_override_processors_cached(monkeypatch):
+    procgen = PlainProcessors()
+    ncalls = []
+    pre_from_style = procgen.pre_from_style
+
+    def counted(*args, **kwds):
+        ncalls.append(1)
+        return pre_from_style(*args, **kwds)
+
+    monkeypatch.setattr(procgen, "pre_from_style", counted)
+    sf = StyleFields({}, procgen)
+    sf.build(["a", "b"])
+    ncalls.clear()
+
+    row = {"a": "x", "b": "y"}
+    style = {"a": {"transform": str.upper}}
+    assert sf.render(row, style=style)[0] == "X y\n"
+    assert len(ncalls) == 2
+    # An equal style reuses the processors.
+    assert sf.render(row, style=dict(style))[0] == "X y\n"
+    assert len(ncalls) == 2
+    # Other styles get their own processors without disturbing the others.
+    other = {"b": {"transform": str.upper}}
+    assert sf.render(row, style=other)[0] == "x Y\n"
+    assert len(ncalls) == 4
+    assert sf.render(row, style=style)[0] == "X y\n"
+    assert sf.render(row)[0] == "x y\n"
+    assert len(ncalls) == 4
+
+
+def test_style_fields_override_processors_bounded(monkeypatch):
+    monkeypatch.setattr(StyleFields, "_override_max", 2)
+    sf = StyleFields({}, PlainProcessors())
+    sf.build(["a"])
+    for idx in range(4):
+        sf.render({"a": "x"}, style={"a": {"missing": str(idx)}})
+    assert len(sf._override_keys) == 2
+    assert "override1" not in sf.fields["a"].registered_keys
+    assert "override4" in sf.fields["a"].registered_keys
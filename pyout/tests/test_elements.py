@@ -1,5 +1,8 @@
+from collections import OrderedDict
+
 import pytest
 
+from pyout import elements
 from pyout.elements import adopt
 from pyout.elements import StyleValidationError
 from pyout.elements import validate
@@ -56,6 +59,51 @@ def test_validate_ok():
     validate({"header_": {"colname": {"bold": True}}})
 
 
+@pytest.fixture
+def validated(monkeypatch):
+    """Replace the cache of validated styles with an empty one.
+    """
+    cache = OrderedDict()
+    monkeypatch.setattr(elements, "_validated", cache)
+    return cache
+
+
+def test_validate_cached(monkeypatch, validated):
+    style = {"name": {"color": "red", "transform": str.upper}}
+    validate(style)
+    assert list(validated) == [elements.fingerprint(style)]
+
+    def fail():
+        raise AssertionError("validator should not be used")
+
+    monkeypatch.setattr(elements, "_get_validator", fail)
+    # An equivalent style doesn't need to be validated again.
+    validate({"name": {"transform": str.upper, "color": "red"}})
+    with pytest.raises(AssertionError):
+        validate({"name": {"color": "blue"}})
+
+
+def test_validate_cached_distinguishes_types(validated):
+    validate({"name": {"bold": True}})
+    with pytest.raises(StyleValidationError):
+        validate({"name": {"bold": 1}})
+
+
+def test_validate_unhashable_value(validated):
+    with pytest.raises(StyleValidationError):
+        validate({"name": {"bold": {1, 2}}})
+    assert not validated
+
+
+def test_validate_cache_bounded(monkeypatch, validated):
+    monkeypatch.setattr(elements, "_validated_max", 2)
+    styles = [{"name": {"width": width}} for width in [1, 2, 3]]
+    for style in styles:
+        validate(style)
+    # The oldest entry is dropped first.
+    assert list(validated) == [elements.fingerprint(s) for s in styles[1:]]
+
+
 def test_value_type():
     assert value_type(True) == "simple"
     assert value_type("red") == "simple"
@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
+from bisect import bisect_right
+import random
+import re
+import timeit
+
 import pytest
 
 from pyout.field import Field
 from pyout.field import Nothing
+from pyout.field import PlainProcessors
 from pyout.field import StyleProcessors
+from pyout.field import TermProcessors
 
 
 def test_field_base():
@@ -57,3 +64,181 @@ def test_style_processor_render():
     sp = StyleProcessors()
     with pytest.raises(NotImplementedError):
         sp.render("key", "value")
+
+
+def test_field_processors_recompiled():
+    def upper(_, result):
+        return result.upper()
+
+    field = Field(width=4, default_keys=["default"], other_keys=["other"])
+    assert field("ok") == "ok  "
+    field.add("post", "default", upper)
+    assert field("ok") == "OK  "
+    field.width = 3
+    assert field("ok") == "OK "
+    assert field("ok", keys=["other"]) == "ok "
+    assert field("ok", exclude_post=True) == "ok "
+
+    with pytest.raises(ValueError):
+        field("ok", keys=["not registered key"])
+
+
+def test_field_register_keys():
+    def upper(_, result):
+        return result.upper()
+
+    field = Field(width=4, default_keys=["default"])
+    with pytest.raises(ValueError):
+        field.add("post", "new", upper)
+    field.register("new")
+    field.add("post", "new", upper)
+    assert field("ok", keys=["new"]) == "OK  "
+    assert field("ok") == "ok  "
+
+    field.unregister("new")
+    with pytest.raises(ValueError):
+        field("ok", keys=["new"])
+    with pytest.raises(ValueError):
+        field.unregister("default")
+
+
+class FakeTerm(object):
+    """Terminal stand-in that records capability lookups.
+    """
+
+    def __init__(self):
+        self.lookups = []
+
+    def __getattr__(self, name):
+        self.lookups.append(name)
+        return "<{}>".format(name)
+
+
+def test_term_processors_codes_resolved_once():
+    term = FakeTerm()
+    procs = TermProcessors(term)
+    nlookups = len(term.lookups)
+    assert "bold" in term.lookups and "red" in term.lookups
+
+    field = Field(width=6, default_keys=["default"])
+    field.add("post", "default",
+              *procs.post_from_style({"bold": True,
+                                      "color": {"lookup": {"b": "red"}}}))
+    assert field("a") == "<bold>a<normal>     "
+    assert field("b") == "<red><bold>b<normal>     "
+    assert field("") == "      "
+    assert len(term.lookups) == nlookups
+
+
+def test_term_processors_reset_only_if_styled():
+    procs = TermProcessors(FakeTerm())
+    field = Field(width=6, default_keys=["default"])
+    field.add("post", "default",
+              *procs.post_from_style({"color": {"lookup": {"b": "red"}}}))
+    assert field("a") == "a     "
+    assert field("b") == "<red>b<normal>     "
+    assert field("a") == "a     "
+
+
+def test_post_from_style_unstyled():
+    procs = TermProcessors(FakeTerm())
+    assert list(procs.post_from_style({})) == []
+    assert list(procs.post_from_style({"align": "left"})) == []
+    assert list(PlainProcessors().post_from_style({"bold": True})) == []
+    assert len(list(procs.post_from_style({"bold": True}))) == 4
+
+
+def interval_lookup_linearly(intervals, value):
+    for start, end, lookup_value in intervals:
+        if start is None:
+            start = float("-inf")
+        if end is None:
+            end = float("inf")
+        if start <= value < end:
+            return lookup_value
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_segment_intervals_matches_linear(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        intervals = []
+        for idx in range(rng.randint(0, 6)):
+            start = rng.choice([None, rng.randint(-5, 5)])
+            end = rng.choice([None, rng.randint(-5, 5)])
+            intervals.append((start, end, rng.choice(["s{}".format(idx),
+                                                      False])))
+        bounds, lookup_values = StyleProcessors._segment_intervals(intervals)
+        for value in [float("-inf")] + [x / 2 for x in range(-14, 15)]:
+            expected = interval_lookup_linearly(intervals, value)
+            assert lookup_values[bisect_right(bounds, value)] == expected, \
+                (intervals, value)
+
+
+def test_combine_regexps_matches_any():
+    regexps = [re.compile(r) for r in ["b", "^a", "x$"]]
+    combined = StyleProcessors._combine_regexps(regexps, 0)
+    for value in ["ab", "ba", "ax", "zx", "zz", "", "a\nb", "xa"]:
+        expected = any(r.search(value) for r in regexps)
+        assert bool(combined.search(value)) == expected, value
+
+    assert StyleProcessors._combine_regexps(
+        [re.compile(r) for r in ["b", "(a)\\1"]], 0) is None
+
+
+def test_re_lookup_miss_not_slower():
+    patterns = ["^err{}$".format(i) for i in range(20)]
+    proc = TermProcessors(FakeTerm()).by_re_lookup(
+        "color", {"re_lookup": [[p, "red"] for p in patterns]})
+    regexps = [re.compile(p) for p in patterns]
+
+    def search_each(value, result):
+        for r in regexps:
+            if r.search(value):
+                return "red"
+        return result
+
+    value = "a value that doesn't match any of the patterns " * 3
+    assert proc(value, value) == search_each(value, value) == value
+
+    def best(fn):
+        return min(timeit.repeat(lambda: fn(value, value),
+                                 number=2000, repeat=5))
+
+    assert best(proc) <= best(search_each)
+
+
+def test_combine_regexps_inline_flags():
+    regexps = [re.compile(r) for r in ["(?i)xyz", "BAR"]]
+    assert StyleProcessors._combine_regexps(regexps, 0) is None
+    # Flags that are scoped to a group or passed for all of the expressions
+    # are fine.
+    assert StyleProcessors._combine_regexps(
+        [re.compile(r) for r in ["(?i:xyz)", "BAR"]], 0) is not None
+    assert StyleProcessors._combine_regexps(
+        [re.compile(r, re.I) for r in ["xyz", "BAR"]], re.I) is not None
+
+    procs = TermProcessors(FakeTerm())
+    field = Field(width=3, default_keys=["default"])
+    field.add("post", "default",
+              *procs.post_from_style(
+                  {"bold": {"re_lookup": [["(?i)xyz", True],
+                                          ["BAR", True]]}}))
+    assert field("XYZ") == "<bold>XYZ<normal>"
+    assert field("bar") == "bar"
+
+
+def test_term_processors_lookups():
+    procs = TermProcessors(FakeTerm())
+    field = Field(width=3, default_keys=["default"])
+    field.add("post", "default",
+              *procs.post_from_style(
+                  {"color": {"interval": [[0, 10, "red"], [5, None, "blue"]]},
+                   "bold": {"re_lookup": [["^1", False], ["1|2", True]]}}))
+    assert field("1") == "<red>1<normal>  "
+    # The first matching regular expression wins.
+    assert field("12") == "<blue>12<normal> "
+    assert field("21") == "<blue><bold>21<normal> "
+    assert field("nan") == "nan"
+    assert field("inf") == "inf"
+    assert field("-3") == "-3 "
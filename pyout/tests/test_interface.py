@@ -4,21 +4,35 @@ pytest.importorskip("blessings")
 
 import inspect
 
+from pyout.interface import AsyncWriter
 from pyout.interface import Stream
 from pyout.interface import Writer
+from pyout.tabular import AsyncTabular
 from pyout.tabular import Tabular
 from pyout.tabular import TerminalStream
 from pyout.tabular_dummy import NoUpdateTerminalStream
+from pyout.tabular_dummy import AsyncTabular as DummyAsyncTabular
 from pyout.tabular_dummy import Tabular as DummyTabular
 
 
 @pytest.mark.parametrize("writer",
-                         [Tabular, DummyTabular],
-                         ids=["tabular", "dummy"])
+                         [Tabular, DummyTabular,
+                          AsyncWriter, AsyncTabular, DummyAsyncTabular],
+                         ids=["tabular", "dummy",
+                              "async", "async-tabular", "async-dummy"])
 def test_writer_children_match_signature(writer):
     assert inspect.signature(writer) == inspect.signature(Writer)
 
 
+def test_writer_positional_parameters():
+    params = inspect.signature(Writer).parameters.values()
+    # Parameters added after max_workers are keyword-only so that existing
+    # positional calls keep working.
+    assert [p.name for p in params if p.kind is p.POSITIONAL_OR_KEYWORD] == \
+        ["columns", "style", "stream", "interactive", "mode",
+         "continue_on_failure", "wait_for_top", "max_workers"]
+
+
 @pytest.mark.parametrize("stream",
                          [TerminalStream, NoUpdateTerminalStream],
                          ids=["terminal", "noupdate"])
@@ -1,4 +1,13 @@
+import pytest
+
+from pyout.field import Nothing
+from pyout.summary import Count
+from pyout.summary import Max
+from pyout.summary import Mean
+from pyout.summary import Min
+from pyout.summary import Sum
 from pyout.summary import Summary
+from pyout.summary import ValueCounts
 
 
 def eq(result, expect):
@@ -51,3 +60,75 @@ def test_summary_summarize_multicolumn_return():
                      {"col1": "a", "col2": "z", "col3": "c"}]),
        [{"col1": "a", "col2": 3, "col3": "c"},
         {"col1": "b", "col2": "", "col3": ""}])
+
+
+@pytest.mark.parametrize("agg,expected",
+                         [(Sum(), 6),
+                          (Count(), 3),
+                          (Min(), 1),
+                          (Max(), 3),
+                          (Mean(), 2),
+                          (ValueCounts(), ["1: 1", "2: 1", "3: 1"])],
+                         ids=["sum", "count", "min", "max", "mean",
+                              "value-counts"])
+def test_summary_aggregate_builtins(agg, expected):
+    state = agg.init()
+    for value in [3, 1, 2]:
+        state = agg.add(state, value)
+    assert agg.result(state) == expected
+
+
+@pytest.mark.parametrize("agg", [Min(), Max(), Mean()],
+                         ids=["min", "max", "mean"])
+def test_summary_aggregate_builtins_empty(agg):
+    state = agg.add(agg.init(), 1)
+    assert agg.result(agg.remove(state, 1)) == ""
+
+
+@pytest.mark.parametrize("agg,expected", [(Min(), 1), (Max(), 3)],
+                         ids=["min", "max"])
+def test_summary_aggregate_min_max_remove(agg, expected):
+    nan = float("nan")
+    state = agg.init()
+    for value in [3, nan, 1.0, True, 2, 1]:
+        state = agg.add(state, value)
+    assert agg.result(state) == expected
+    for value in [nan, 1, True, 2]:
+        state = agg.remove(state, value)
+    assert state == [1.0, 3]
+    # A value that was never added isn't silently dropped in place of
+    # another one.
+    with pytest.raises(ValueError):
+        agg.remove(state, 4)
+    assert state == [1.0, 3]
+
+
+def test_summary_summarize_incremental():
+    sm = Summary({"col1": {"aggregate": ValueCounts()},
+                  "col2": {"aggregate": Sum()},
+                  "col3": {"aggregate": len}})
+    rows = [{"col1": "a", "col2": 1, "col3": "x"},
+            {"col1": "b", "col2": 2, "col3": "y"},
+            {"col1": "a", "col2": Nothing(), "col3": "z"}]
+    for row in rows:
+        sm.add(row)
+    eq(sm.summarize(["col1", "col2", "col3"], rows),
+       [{"col1": "a: 2", "col2": 3, "col3": 3},
+        {"col1": "b: 1", "col2": "", "col3": ""}])
+
+    sm.remove(rows[1])
+    rows[1] = {"col1": "a", "col2": 10, "col3": "y"}
+    sm.add(rows[1])
+    eq(sm.summarize(["col1", "col2", "col3"], rows),
+       [{"col1": "a: 3", "col2": 11, "col3": 3}])
+
+
+def test_summary_summarize_incremental_skips_rows():
+    sm = Summary({"col1": {"aggregate": Count()}})
+    sm.add({"col1": "a"})
+
+    def rows():
+        raise AssertionError("rows should not be consumed")
+        yield
+
+    eq(sm.summarize(["col1"], rows()), [{"col1": 1}])
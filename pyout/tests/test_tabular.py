@@ -3,9 +3,13 @@ import pytest
 
 pytest.importorskip("blessings")
 
+import asyncio
 from collections import Counter
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import os
+import re
 import sys
 import time
 import threading
@@ -14,7 +18,10 @@ import traceback
 from pyout.common import ContentError
 from pyout.elements import StyleError
 from pyout.field import StyleFunctionError
+from pyout.summary import Sum
+from pyout.summary import ValueCounts
 
+from pyout.tests.tabular import AsyncTabular
 from pyout.tests.tabular import Tabular
 from pyout.tests.terminal import assert_contains_nc
 from pyout.tests.terminal import capres
@@ -421,6 +428,21 @@ def test_tabular_content_get_idkey():
         out._content.get_idkey(4)
 
 
+def test_tabular_content_len():
+    out = Tabular(["name", "status"], style={"header_": {}})
+    out({"name": "foo", "status": "ok"})
+    out({"name": "bar", "status": "ok"})
+    out({"name": "foo", "status": "done"})
+    assert len(out._content) == 3
+    assert out._content.get_idkey(0) is None
+    assert out._content.get_idkey(2) == ("bar",)
+
+    with pytest.raises(IndexError):
+        out._content.get_idkey(-1)
+    with pytest.raises(IndexError):
+        out._content.get_idkey(3)
+
+
 def test_tabular_write_lookup_color():
     out = Tabular(style={"name": {"width": 3},
                          "status": {"color": {"lookup": {"BAD": "red"}},
@@ -698,6 +720,39 @@ def test_tabular_write_transform_func_error():
             del tb
 
 
+@pytest.mark.parametrize("memoize", [False, True, 1])
+def test_tabular_write_transform_memoize(memoize):
+    ncalls = Counter()
+
+    def double(x):
+        ncalls[x] += 1
+        return x * 2
+
+    out = Tabular(style={"val": {"transform": double, "memoize": memoize}})
+    out(OrderedDict([("name", "foo"), ("val", 1)]))
+    out(OrderedDict([("name", "bar"), ("val", 2)]))
+    out(OrderedDict([("name", "baz"), ("val", 1)]))
+    # Widen the name column to force a repaint.
+    out(OrderedDict([("name", "longer"), ("val", 2)]))
+    assert_contains_nc(out.stdout.splitlines(),
+                       "foo    2", "bar    4", "baz    2", "longer 4")
+    if memoize is True:
+        assert ncalls == {1: 1, 2: 1}
+    elif memoize == 1:
+        # Only the most recent value is remembered, so alternating values
+        # miss, but measuring and then rendering the same value hits.
+        assert ncalls == {1: 2, 2: 2}
+    else:
+        assert ncalls == {1: 4, 2: 4}
+
+
+def test_tabular_write_transform_memoize_unhashable():
+    out = Tabular(["name", "val"],
+                  style={"val": {"transform": len, "memoize": True}})
+    out({"name": "foo", "val": [1, 2]})
+    assert_contains_nc(out.stdout.splitlines(), "foo 2")
+
+
 def test_tabular_write_width_truncate_long():
     out = Tabular(style={"name": {"width": 8},
                          "status": {"width": 3}})
@@ -739,6 +794,61 @@ def test_tabular_write_autowidth_with_header():
     assert_contains_nc(lines, "name   status")
 
 
+def test_tabular_write_autowidth_round():
+    out = Tabular(["name", "status"],
+                  style={"name": {"width": {"round": 4}}})
+    for name in ["a", "ab", "abc", "abcd", "abcde"]:
+        out({"name": name, "status": "ok"})
+
+    lines = out.stdout.splitlines()
+    # Only the fifth row required a repaint.
+    assert lines[:4] == ["a    ok", "ab   ok", "abc  ok", "abcd ok"]
+    assert_contains_nc(lines, "abcde    ok")
+    assert len(lines) == 4 + 5
+
+
+def test_tabular_write_autowidth_grow():
+    out = Tabular(["name", "status"],
+                  style={"name": {"width": {"grow": 1}}})
+    for name in ["abc", "abcd", "abcdef", "abcdefg"]:
+        out({"name": name, "status": "ok"})
+
+    lines = out.stdout.splitlines()
+    # The second row doubled the width, making room for the third.
+    assert_contains_nc(lines, "abcdef ok")
+    assert_contains_nc(lines, "abcdefg      ok")
+    assert len(lines) == 1 + 2 + 1 + 4
+
+
+def test_tabular_write_autowidth_freeze():
+    out = Tabular(["name", "status"],
+                  style={"header_": {},
+                         "name": {"width": {"freeze": 2, "marker": "…"}}})
+    for name in ["a", "abcd", "abcdefgh"]:
+        out({"name": name, "status": "ok"})
+
+    lines = out.stdout.splitlines()
+    assert_contains_nc(lines, "name status", "abcd ok    ", "abc… ok    ")
+
+
+def test_tabular_write_autowidth_freeze_counts_new_rows():
+    out = Tabular(["name", "status"],
+                  style={"name": {"width": {"freeze": 3}}})
+    for status in ["a", "b", "c"]:
+        out({"name": "a", "status": status})
+    out({"name": "longer", "status": "ok"})
+
+    lines = out.stdout.splitlines()
+    # The updates to the first row don't count toward the limit.
+    assert_contains_nc(lines, "a      c ", "longer ok")
+
+
+def test_tabular_write_autowidth_growth_with_width():
+    with pytest.raises(ValueError):
+        Tabular(["name"], style={"name": {"width": {"width": 3,
+                                                    "round": 2}}})(["foo"])
+
+
 def test_tabular_write_autowidth_min():
     out = Tabular(style={"name": {"width": "auto"},
                          "status": {"width": {"min": 5}},
@@ -1120,6 +1230,31 @@ def test_tabular_callback_wait_for_top(header):
     thread.join()
 
 
+@pytest.mark.timeout(10)
+def test_tabular_callback_wait_for_top_wakes_up():
+    event = threading.Event()
+
+    def slow():
+        event.wait()
+        return "done"
+
+    with Tabular(["name", "status"],
+                 wait_for_top=1, wait_for_top_delay=0) as out:
+        out({"name": "foo00", "status": slow})
+        for i in range(1, 19):
+            out({"name": "foo{:02d}".format(i), "status": "ok"})
+        # The next row would take "foo00" off screen, so it waits.
+        timer = threading.Timer(0.1, event.set)
+        timer.start()
+        start = time.time()
+        out({"name": "foo19", "status": "ok"})
+        elapsed = time.time() - start
+    # The row is written as soon as the worker is done rather than at the
+    # next polling interval.
+    assert elapsed < 0.4
+    assert_contains_nc(out.stdout.splitlines(), "foo00 done")
+
+
 @pytest.mark.timeout(10)
 @pytest.mark.parametrize("result",
                          [{"status": "done", "path": "/tmp/a"},
@@ -1218,6 +1353,314 @@ def test_tabular_write_callable_cancel_on_exception():
     assert out.stdout.splitlines()[:2] == ["foo", "bar"]
 
 
+@pytest.mark.timeout(10)
+def test_tabular_write_callable_futures_released():
+    def fail():
+        raise TypeError("wrong")
+
+    out = Tabular(["name", "status"], wait_for_top=0)
+    with out:
+        for i in range(50):
+            out({"name": "foo{:02d}".format(i),
+                 "status": fail if i == 3 else (lambda: "ok")})
+        failed = out.wait()
+    # Only the failed future is kept around.
+    assert [id_key for id_key, _ in failed] == [("foo03",)]
+    assert not out._futures
+    assert not out._pending
+    assert "foo49 ok" in out.stdout
+
+
+@pytest.mark.timeout(10)
+def test_tabular_write_callable_max_pending():
+    event = threading.Event()
+    nrunning = []
+
+    def slow():
+        nrunning.append(1)
+        event.wait()
+        return "done"
+
+    out = Tabular(["name", "status"], max_pending=2, wait_for_top=0)
+    written = []
+
+    def run_tabular():
+        with out:
+            for i in range(4):
+                out({"name": "foo{}".format(i), "status": slow})
+                written.append(i)
+
+    thread = threading.Thread(target=run_tabular)
+    thread.daemon = True
+    thread.start()
+    while len(nrunning) < 2:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    # The row for the third producer is written, but its producer isn't
+    # submitted until one of the first two finishes.
+    assert written == [0, 1]
+    assert len(out._pending) == 2
+    event.set()
+    thread.join()
+    assert written == [0, 1, 2, 3]
+    assert_contains_nc(out.stdout.splitlines(),
+                       "foo0 done", "foo3 done")
+
+
+def test_tabular_max_pending_invalid():
+    with pytest.raises(ValueError):
+        Tabular(["name", "status"], max_pending=0)
+
+
+@pytest.mark.timeout(10)
+def test_tabular_write_callable_multiple_producers():
+    def slow():
+        time.sleep(0.05)
+        return "a-done"
+
+    def fast_gen():
+        yield "b-done"
+
+    # The results come in after the loop over the row's producers has moved
+    # on to the later ones.
+    with Tabular(["name", "a", "b", "c"], mode="final") as out:
+        out({"name": "foo", "a": slow, "b": fast_gen,
+             "c": lambda: "c-done"})
+    assert out[("foo",)] == {"name": "foo", "a": "a-done",
+                             "b": "b-done", "c": "c-done"}
+
+
+@pytest.mark.timeout(10)
+def test_tabular_write_callable_shared_executor():
+    def fail():
+        raise TypeError("wrong")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        for name in ["foo", "bar"]:
+            with Tabular(["name", "status"], executor=executor) as out:
+                out({"name": name, "status": lambda: "done"})
+            assert_contains_nc(out.stdout.splitlines(), name + " done")
+
+        with pytest.raises(TypeError):
+            with Tabular(["name", "status"], executor=executor,
+                         continue_on_failure=False) as out:
+                out({"name": "foo", "status": fail})
+                external = executor.submit(lambda: "external")
+        # The executor wasn't shut down, and the abort only canceled the
+        # instance's own futures.
+        assert external.result() == "external"
+        assert executor.submit(lambda: "still up").result() == "still up"
+
+
+@pytest.mark.timeout(10)
+def test_tabular_write_callable_executor_wait_for_results():
+    def slow():
+        time.sleep(0.02)
+        return "done"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        out = Tabular(["name", "status"], mode="final", executor=executor)
+        write_async_result = out._write_async_result
+
+        def slow_write(*args):
+            # The result callback runs after the future is marked as done.
+            time.sleep(0.1)
+            write_async_result(*args)
+
+        out._write_async_result = slow_write
+        with out:
+            out({"name": "foo", "status": ("pending", slow)})
+    assert out.stdout.splitlines() == ["foo done"]
+
+
+def process_id():
+    return str(os.getpid())
+
+
+def process_ids():
+    yield "started"
+    yield "in " + process_id()
+
+
+def process_fail():
+    raise TypeError("wrong")
+
+
+def process_slow_ids():
+    yield "started"
+    time.sleep(2)
+    yield "late"
+
+
+@pytest.mark.timeout(20)
+def test_tabular_write_callable_process_executor():
+    parent = str(os.getpid())
+    with Tabular(["name", "pid", "gen"], mode="final",
+                 style={"pid": {"executor": "process"},
+                        "gen": {"executor": "process"}}) as out:
+        out({"name": "foo", "pid": process_id, "gen": process_ids})
+        # Generator objects can't be pickled and are run in a thread.
+        out({"name": "bar", "pid": process_id,
+             "gen": (x for x in ["thread"])})
+
+    foo, bar = [ln.split() for ln in out.stdout.splitlines()]
+    assert foo[0] == "foo"
+    assert foo[1] != parent
+    assert foo[2:] == ["in", foo[1]]
+    assert bar[0] == "bar"
+    assert bar[1] != parent
+    assert bar[2] == "thread"
+
+
+@pytest.mark.timeout(20)
+def test_tabular_write_callable_process_executor_failure():
+    with pytest.raises(TypeError):
+        with Tabular(["name", "status"],
+                     style={"status": {"executor": "process"}},
+                     continue_on_failure=False) as out:
+            out({"name": "foo", "status": process_fail})
+
+
+@pytest.mark.timeout(20)
+def test_tabular_write_callable_process_executor_abort():
+    with pytest.raises(RuntimeError):
+        with Tabular(["name", "gen"], mode="final",
+                     style={"gen": {"executor": "process"}}) as out:
+            out({"name": "foo", "gen": process_slow_ids})
+            manager = out._manager
+            raise RuntimeError("abort")
+    # The manager's server process is shut down on abort too.
+    assert out._manager is None
+    assert not manager._process.is_alive()
+    # The thread reading the generator's items stops (without tripping over
+    # the shut down manager) rather than waiting on the worker process.
+    with out._done_cond:
+        assert out._done_cond.wait_for(lambda: not out._pending, timeout=1)
+    assert not out._failed
+
+
+@pytest.mark.parametrize("delayed", [True, "group"], ids=["own", "group"])
+def test_tabular_write_delayed_process_executor_exception(delayed):
+    out = Tabular(["name", "status"],
+                  style={"status": {"delayed": delayed,
+                                    "executor": "process"}})
+    with pytest.raises(ValueError):
+        out({"name": "foo", "status": "ok"})
+    assert out.stdout == ""
+
+
+@pytest.mark.timeout(10)
+def test_async_tabular_producers():
+    async def status():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def counts():
+        for i in range(3):
+            await asyncio.sleep(0)
+            yield i
+
+    async def main():
+        async with AsyncTabular(["name", "status"], mode="final") as out:
+            out({"name": "cofn", "status": status})
+            out({"name": "coro", "status": ("waiting", status())})
+            out({"name": "agenfn", "status": counts})
+            out({"name": "agen", "status": counts()})
+            out({"name": "thread", "status": lambda: "threaded"})
+            out.extend([{"name": "ext", "status": status}])
+        return out
+
+    out = asyncio.run(main())
+    lines = out.stdout.splitlines()
+    assert_contains_nc(lines,
+                       "cofn   done    ",
+                       "coro   done    ",
+                       "agenfn 2       ",
+                       "agen   2       ",
+                       "thread threaded",
+                       "ext    done    ")
+
+
+@pytest.mark.timeout(10)
+def test_async_tabular_does_not_block_loop():
+    event = threading.Event()
+
+    def slow():
+        event.wait()
+        return "done"
+
+    async def main():
+        asyncio.get_running_loop().call_later(0.1, event.set)
+        async with AsyncTabular(["name", "status"], wait_for_top=1,
+                                max_pending=1) as out:
+            for i in range(20):
+                out({"name": "foo{:02d}".format(i), "status": slow})
+            # Waiting for room among the pending producers or for the top
+            # row's producer would have blocked the loop, which sets the
+            # event.
+            assert not event.is_set()
+        return out
+
+    out = asyncio.run(main())
+    assert_contains_nc(out.stdout.splitlines(), "foo00 done", "foo19 done")
+
+
+@pytest.mark.timeout(10)
+def test_async_tabular_concurrency():
+    running = []
+    most = []
+
+    async def status():
+        running.append(1)
+        most.append(len(running))
+        await asyncio.sleep(0.001)
+        running.pop()
+        return "ok"
+
+    async def main():
+        out = AsyncTabular(["name", "status"], mode="final", max_workers=3)
+        for i in range(200):
+            out({"name": "row{}".format(i), "status": status})
+        assert await out.wait() == []
+        # No threads were needed.
+        assert out._pool is None
+        return out
+
+    out = asyncio.run(main())
+    assert len(most) == 200
+    assert max(most) == 3
+    assert out[("row199",)]["status"] == "ok"
+
+
+@pytest.mark.timeout(10)
+def test_async_tabular_failures():
+    async def fail():
+        raise TypeError("wrong")
+
+    async def slow():
+        await asyncio.sleep(5)
+        return "done"
+
+    async def main(**kwds):
+        async with AsyncTabular(["name", "status"], **kwds) as out:
+            out({"name": "foo", "status": fail})
+            out({"name": "bar", "status": slow if kwds else "bar"})
+        return out
+
+    out = asyncio.run(main())
+    assert "1 asynchronous worker failed" in out.stdout
+    assert "TypeError: wrong" in out.stdout
+
+    with pytest.raises(TypeError):
+        asyncio.run(main(continue_on_failure=False))
+
+
+def test_async_tabular_requires_async_with():
+    with pytest.raises(TypeError):
+        with AsyncTabular(["name", "status"]):
+            pass
+
+
 @pytest.mark.timeout(10)
 def test_tabular_write_callable_kb_interrupt_in_exit():
     delay0 = Delayed("v0")
@@ -1546,6 +1989,30 @@ def test_tabular_summary():
                        "     2 failed 17 ")
 
 
+def test_tabular_summary_incremental():
+    out = Tabular(style={"header_": {},
+                         "status": {"aggregate": ValueCounts()},
+                         "num": {"aggregate": Sum()}})
+
+    out(OrderedDict([("name", "foo"),
+                     ("status", "BAD"),
+                     ("num", 2)]))
+    out(OrderedDict([("name", "bar"),
+                     ("status", "BAD"),
+                     ("num", 3)]))
+    # Update "foo".
+    out(OrderedDict([("name", "foo"),
+                     ("status", "OK"),
+                     ("num", 10)]))
+
+    lines = out.stdout.splitlines()
+    assert_contains_nc(lines,
+                       "     BAD: 1 2  ",
+                       "     BAD: 2 5  ",
+                       "     BAD: 1 13 ",
+                       "     OK: 1     ")
+
+
 def test_tabular_shrinking_summary():
 
     def counts(values):
@@ -1638,3 +2105,346 @@ def test_tabular_mode_final_summary():
     lines = out.stdout.splitlines()
     # Expect three lines, two regular rows and one summary.
     assert len(lines) == 3
+
+
+def test_tabular_mode_final_widths_from_final_values():
+    out = Tabular(["name", "status"],
+                  style={"header_": {},
+                         "status": {"aggregate": len}},
+                  mode="final")
+
+    with out:
+        out({"name": "foo", "status": "a-long-status"})
+        out({"name": "bar", "status": "ok"})
+        out({"name": "foo", "status": "ok"})
+
+    lines = out.stdout.splitlines()
+    # The width of "status" only accounts for the header and final values.
+    assert_eq_repr(lines, ["name status",
+                           "foo  ok    ",
+                           "bar  ok    ",
+                           "     2     "])
+
+
+def test_tabular_mode_final_chunks():
+    rows = [{"name": "n{}".format(i), "status": "s" * (i % 7)}
+            for i in range(25)]
+
+    def render(nlines):
+        out = Tabular(["name", "status"],
+                      style={"header_": {}, "status": {"aggregate": len}},
+                      mode="final")
+        with out:
+            for row in rows:
+                out(row)
+        return list(out._content.render_chunks(nlines=nlines)), out.stdout
+
+    chunks, stdout = render(1000)
+    assert chunks == [stdout]
+    for nlines in [1, 4, 25]:
+        chunks, _ = render(nlines)
+        assert "".join(chunks) == stdout
+        assert all(len(c.splitlines()) <= nlines for c in chunks)
+
+
+@pytest.mark.parametrize("mode", ["final", "log"])
+def test_tabular_mode_final_unhide_late(mode):
+    # The earlier rows are measured for the column that a later row unhides.
+    with Tabular(["name", "extra"], mode=mode,
+                 style={"extra": {"hide": "if_missing",
+                                  "missing": "N/A"}}) as out:
+        out({"name": "a"})
+        out({"name": "b"})
+        out({"name": "c", "extra": "x"})
+    assert out.stdout.splitlines() == ["a N/A", "b N/A", "c x  "]
+
+
+def test_tabular_mode_log():
+    out = Tabular(["name", "status"],
+                  style={"header_": {}},
+                  mode="log", log_sample=2)
+
+    with out:
+        out({"name": "foo", "status": "unknown"})
+        # Nothing is written until the sample is full.
+        assert out.stdout == ""
+        # Updates to held-back rows are merged.
+        out({"name": "foo", "status": "ok"})
+        out({"name": "bar", "status": "ok"})
+        lines = out.stdout.splitlines()
+        assert_eq_repr(lines, ["name status",
+                               "foo  ok    ",
+                               "bar  ok    "])
+        # The rows aren't kept around once they're written.
+        assert not out._content._rows
+        # Later values are truncated to the inferred widths.
+        out({"name": "bazzz", "status": "failed"})
+        # An update to a written row gets its own line.
+        out({"name": "foo", "status": "gone"})
+
+    lines = out.stdout.splitlines()
+    assert_eq_repr(lines, ["name status",
+                           "foo  ok    ",
+                           "bar  ok    ",
+                           "b... failed",
+                           "foo  gone  "])
+
+
+@pytest.mark.timeout(10)
+def test_tabular_mode_log_producer_after_sample():
+    with Tabular(["name", "status", "other"],
+                 style={"other": {"missing": "-"}},
+                 mode="log", log_sample=1) as out:
+        out({"name": "a", "status": "ok", "other": "x"})
+        # The produced value is written after the sample, on its own line
+        # and without the columns that weren't produced.
+        out({"name": "b", "status": ("no", lambda: "ya"), "other": "z"})
+
+    assert_eq_repr(out.stdout.splitlines(), ["a ok x",
+                                             "b no z",
+                                             "b ya -"])
+
+
+def test_tabular_mode_log_short():
+    out = Tabular(["name", "status"], mode="log", log_sample=10)
+    with out:
+        out({"name": "foo", "status": "ok"})
+        out({"name": "bar", "status": "unknown"})
+        assert out.stdout == ""
+    assert_eq_repr(out.stdout.splitlines(), ["foo ok     ",
+                                             "bar unknown"])
+
+
+def test_tabular_mode_log_fixed_widths():
+    out = Tabular(["name", "status"],
+                  style={"width_": 10,
+                         "name": {"width": 4},
+                         "status": {"width": 5}},
+                  mode="log")
+    with out:
+        out({"name": "foo", "status": "ok"})
+        # Without automatic widths, there's no need to hold back rows.
+        assert_eq_repr(out.stdout.splitlines(), ["foo  ok   "])
+
+
+def test_tabular_refresh_hz_coalesces():
+    out = Tabular(["name", "status"], refresh_hz=0.1)
+    with out:
+        out({"name": "foo", "status": "a"})
+        for i in range(10):
+            out({"name": "foo", "status": str(i)})
+        out({"name": "bar", "status": "ok"})
+        # Nothing is written until the context manager exits.
+        assert out.stdout == ""
+    lines = out.stdout.splitlines()
+    assert_contains_nc(lines, "foo 9 ", "bar ok")
+    # The intermediate values for "foo" were never written.
+    assert not [ln for ln in lines
+                if "foo a" in ln or "foo 0" in ln or "foo 8" in ln]
+
+
+@pytest.mark.timeout(10)
+def test_tabular_refresh_hz_background_write():
+    out = Tabular(["name", "status"], refresh_hz=50)
+    with out:
+        out({"name": "foo", "status": "ok"})
+        while not out.stdout:
+            time.sleep(0.01)
+        assert out.stdout == "foo ok\n"
+
+
+@pytest.mark.timeout(10)
+def test_tabular_refresh_hz_callable_values():
+    delay = Delayed("done")
+    with Tabular(["name", "status"], refresh_hz=50) as out:
+        out({"name": "foo", "status": ("thinking", delay.run)})
+        out({"name": "bar", "status": "ok"})
+        delay.now = True
+    lines = out.stdout.splitlines()
+    assert_contains_nc(lines, "foo done")
+
+
+@pytest.mark.parametrize("repaint", ["all", "visible", "visible_then_all"])
+def test_tabular_repaint_visible(repaint):
+    out = Tabular(["name", "status"], repaint=repaint)
+    with out:
+        for i in range(25):
+            out({"name": "foo{:02d}".format(i), "status": "ok"})
+        # Widening the name column triggers a repaint.
+        out({"name": "longername", "status": "ok"})
+        # An update to a row that is off screen.
+        out({"name": "foo00", "status": "no"})
+
+    lines = [ln.replace(unicode_cap("cuu1"), "")
+             for ln in out.stdout.splitlines()]
+    nrepainted = len([ln for ln in lines if re.match("foo[0-9]{2}      ", ln)])
+    # The test terminal height is 20.  With one line for the cursor, 19 rows
+    # are visible.
+    if repaint == "all":
+        # The off-screen update also leads to a full repaint.
+        assert nrepainted == 25 * 2
+        assert "foo00      no" in lines
+    elif repaint == "visible":
+        assert nrepainted == 19
+        assert "foo00      no" not in lines
+    else:
+        # The whole table is written again at exit.
+        assert nrepainted == 19 + 25
+        assert lines[-26:-24] == ["foo00      no", "foo01      ok"]
+
+
+def test_tabular_repaint_invalid():
+    with pytest.raises(ValueError):
+        Tabular(["name", "status"], repaint="unknown")
+
+
+def test_tabular_repaint_reuses_rendered_fields():
+    ncalls = Counter()
+
+    def count(value):
+        ncalls[value] += 1
+        return value
+
+    out = Tabular(["name", "status"],
+                  style={"status": {"transform": count, "width": 4}})
+    out({"name": "foo", "status": "ok"})
+    out({"name": "bar", "status": "ok"})
+    assert ncalls["ok"] == 2
+
+    # Widening the name column triggers a repaint, but the status fields of
+    # the earlier rows aren't affected.
+    out({"name": "foobar", "status": "-"})
+    assert ncalls["ok"] == 2
+    assert_contains_nc(out.stdout.splitlines(),
+                       "foo    ok  ", "bar    ok  ", "foobar -   ")
+
+    # An update invalidates the row's cache.
+    out({"name": "bar", "status": "ok"})
+    assert ncalls["ok"] == 3
+
+
+def test_tabular_extend():
+    rows = [{"name": "foo{}".format(i), "status": "ok"} for i in range(5)]
+    out = Tabular(style={"header_": {}, "status": {"aggregate": len}})
+    out.extend(rows)
+    assert not out.stdout.count(unicode_cap("cuu1"))
+    assert_eq_repr(out.stdout.splitlines(),
+                   ["name status",
+                    "foo0 ok    ",
+                    "foo1 ok    ",
+                    "foo2 ok    ",
+                    "foo3 ok    ",
+                    "foo4 ok    ",
+                    "     5     "])
+
+    # Appending rows that fit doesn't touch the lines already written.
+    nchars = len(out.stdout)
+    out.extend([{"name": "bar", "status": "ok"}])
+    assert_eq_repr(out.stdout[nchars:].splitlines(),
+                   [unicode_cap("cuu1") + unicode_cap("ed") + "bar  ok    ",
+                    "     6     "])
+
+    # An update and a wider value lead to a single repaint.
+    nchars = len(out.stdout)
+    out.extend([{"name": "foo1", "status": "gone"},
+                {"name": "bazzzzz", "status": "ok"}])
+    lines = out.stdout[nchars:].splitlines()
+    assert_eq_repr(lines,
+                   [unicode_cap("cuu1") + unicode_cap("ed") +
+                    unicode_cap("cuu1") * 7 + "name    status",
+                    "foo0    ok    ",
+                    "foo1    gone  ",
+                    "foo2    ok    ",
+                    "foo3    ok    ",
+                    "foo4    ok    ",
+                    "bar     ok    ",
+                    "bazzzzz ok    ",
+                    "        7     "])
+
+
+@pytest.mark.parametrize("mode", ["update", "incremental", "final", "log"])
+def test_tabular_extend_modes(mode):
+    out = Tabular(["name", "status"], mode=mode)
+    with out:
+        out.extend([{"name": "foo", "status": "unknown"},
+                    {"name": "bar", "status": "ok"},
+                    {"name": "foo", "status": "ok"}])
+        out.extend([])
+    # The update to "foo" is merged before anything is rendered, so the
+    # initial value doesn't show up or affect the widths.
+    assert out.stdout.splitlines() == ["foo ok", "bar ok"]
+
+
+def test_tabular_extend_incremental_updates():
+    out = Tabular(["name", "status"], mode="incremental")
+    with out:
+        out.extend([{"name": str(i), "status": "x"} for i in range(5)])
+        nchars = len(out.stdout)
+        # Updates that don't change the widths only write the touched lines,
+        # like they do when written one at a time.
+        out.extend([{"name": "3", "status": "y"}])
+        out.extend([{"name": "1", "status": "z"},
+                    {"name": "5", "status": "x"}])
+        assert out.stdout[nchars:].splitlines() == ["3 y", "1 z", "5 x"]
+        nchars = len(out.stdout)
+        # A width change rewrites everything.
+        out.extend([{"name": "0", "status": "long"}])
+        assert out.stdout[nchars:].splitlines() == [
+            "0 long", "1 z   ", "2 x   ", "3 y   ", "4 x   ", "5 x   "]
+
+
+def test_tabular_refresh_hz_incremental_callable():
+    def slow():
+        # Give the earlier rows a chance to go out in their own frame.
+        time.sleep(0.1)
+        return "y"
+
+    out = Tabular(["name", "status"], mode="incremental", refresh_hz=50)
+    with out:
+        out.extend([{"name": str(i), "status": "x"} for i in range(3)])
+        out({"name": "9", "status": ("x", slow)})
+    lines = out.stdout.splitlines()
+    # The produced value adds a line rather than a copy of the table.
+    assert lines[:3] == ["0 x", "1 x", "2 x"]
+    assert lines.count("0 x") == 1
+    assert lines[-1] == "9 y"
+
+
+def test_tabular_extend_callables():
+    out = Tabular(["name", "status"])
+    with out:
+        out.extend([{"name": "foo", "status": ("-", lambda: "done")},
+                    {"name": "bar", "status": "ok"}])
+    assert_contains_nc(out.stdout.splitlines(), "foo done", "bar ok  ")
+
+
+def test_tabular_extend_columnar():
+    out = Tabular(style={"header_": {}})
+    out.extend(OrderedDict([("name", ["foo", "bar"]),
+                            ("status", ["ok", "unknown"])]))
+    assert_eq_repr(out.stdout.splitlines(),
+                   ["name status ",
+                    "foo  ok     ",
+                    "bar  unknown"])
+    # The rows are available for later updates.
+    out({"name": "foo", "status": "done"})
+    assert out[("foo",)] == {"name": "foo", "status": "done"}
+
+
+@pytest.mark.parametrize("mode", ["final", "incremental", "update"])
+def test_tabular_extend_columnar_empty(mode):
+    out = Tabular(["name", "count"], mode=mode,
+                  style={"header_": {},
+                         "count": {"aggregate": Sum()}})
+    with out:
+        out.extend({"name": [], "count": []})
+    assert out.stdout == ""
+
+
+def test_tabular_extend_columnar_invalid():
+    out = Tabular(["name", "status"])
+    with pytest.raises(ValueError):
+        out.extend({"name": "foo", "status": "bar"})
+    with pytest.raises(ValueError):
+        out.extend({"name": ["foo", "bar"], "status": ["ok"]})
+    assert out.stdout == ""